@@ -0,0 +1,64 @@
+"""
+API payloads for the CPU and memory benchmarks, built from the fixtures in
+tests/example so they match what the test suite parses.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "tests" / "example"
+
+
+def example(name: str) -> Any:
+    return json.loads((EXAMPLES / f"{name}.json").read_text())
+
+
+def map_stations(count: int) -> List[Dict[str, Any]]:
+    """``count`` map stations cycling through the example ones, with unique device IDs."""
+    templates = example("nearby_stations")["map_data"]["stations"]
+    stations = []
+    for n in range(count):
+        station = copy.deepcopy(templates[n % len(templates)])
+        station["device_id"] = 10_000_000 + n
+        station["lat"] = station["lon"] = n / count
+        stations.append(station)
+    return stations
+
+
+def map_response(count: int) -> bytes:
+    """Body of a map API (``mapcache/v2``) response holding ``count`` stations."""
+    return json.dumps(
+        {"map_data": {"favorites": [], "stations": map_stations(count)}}
+    ).encode()
+
+
+def station_info() -> bytes:
+    """Body of a ``v3/station/info`` response."""
+    return json.dumps(example("station_info")).encode()
+
+
+def charging_status(points: int) -> bytes:
+    """
+    Body of a ``driver-bff/v1/sessions`` response whose update_data holds
+    ``points`` readings, ten seconds apart.
+    """
+    status = example("charging_status")
+    start = status["start_time"]
+    status["update_data"] = [
+        {"energy_kwh": n * 0.02, "power_kw": 7.2, "timestamp": start + n * 10_000}
+        for n in range(points)
+    ]
+    status["last_update_data_timestamp"] = start + (points - 1) * 10_000
+    return json.dumps({"charging_status": status}).encode()
+
+
+def per_call(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Best-of-``repeat`` seconds per call of ``func``."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
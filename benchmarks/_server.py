@@ -0,0 +1,151 @@
+"""
+Local stand-in for the ChargePoint API used by the benchmarks.
+
+Every endpoint host in tests/example/global_config.json is rewritten to one
+aiohttp server on 127.0.0.1, and a static discovery cache hands that
+configuration to ChargePoint.create(), so no benchmark touches the network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import re
+import time
+from contextlib import contextmanager
+from http.cookies import SimpleCookie
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Set, Tuple
+
+from aiohttp import web
+
+from python_chargepoint.cache import DiscoveryCache
+from python_chargepoint.global_config import GlobalConfiguration
+
+ROOT = Path(__file__).resolve().parent.parent
+GLOBAL_CONFIG = ROOT / "tests" / "example" / "global_config.json"
+PROFILE_PATH = "/account/v1/driver/profile/user"
+
+
+def token_for(username: str) -> str:
+    return f"tok-{username}"
+
+
+def global_config(base_url: str) -> GlobalConfiguration:
+    """The example configuration with every endpoint host replaced by base_url."""
+    text = re.sub(r"https://[^/\"]+", base_url, GLOBAL_CONFIG.read_text())
+    return GlobalConfiguration.model_validate_json(text)
+
+
+def open_sockets() -> int:
+    """Number of sockets this process has open (Linux only)."""
+    fds = Path("/proc/self/fd")
+    count = 0
+    for fd in fds.iterdir():
+        try:
+            count += os.readlink(fd).startswith("socket:")
+        except OSError:
+            pass
+    return count
+
+
+class StaticDiscoveryCache(DiscoveryCache):
+    """Returns the same configuration for every username."""
+
+    def __init__(self, config: GlobalConfiguration):
+        super().__init__()
+        self._payload = config.model_dump_json(by_alias=True)
+
+    def _read(self, key: str) -> Optional[Tuple[str, float]]:
+        return self._payload, time.time()
+
+    def _write(self, key: str, payload: str, stored_at: float) -> None:
+        pass
+
+
+class MockChargePoint:
+    """
+    Serves the account profile for any ``tok-<username>`` session token. Add
+    routes to ``app`` before entering the context manager. ``peers`` collects
+    the client address of every connection the server accepted.
+    """
+
+    def __init__(self) -> None:
+        self.app = web.Application(middlewares=[self._track])
+        self.app.router.add_get(PROFILE_PATH, self._profile)
+        self.peers: Set[Tuple[str, int]] = set()
+        self.requests = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    async def __aenter__(self) -> MockChargePoint:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0, backlog=4096)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        assert self._runner is not None
+        await self._runner.cleanup()
+
+    def discovery_cache(self) -> StaticDiscoveryCache:
+        return StaticDiscoveryCache(global_config(self.base_url))
+
+    @web.middleware
+    async def _track(self, request: web.Request, handler):
+        self.requests += 1
+        peer = (
+            request.transport.get_extra_info("peername") if request.transport else None
+        )
+        if peer:
+            self.peers.add(peer[:2])
+        return await handler(request)
+
+    async def _profile(self, request: web.Request) -> web.Response:
+        token = request.headers.get("cp-session-token", "")
+        if not token:
+            cookie = SimpleCookie(request.headers.get("Cookie", ""))
+            token = cookie["coulomb_sess"].value if "coulomb_sess" in cookie else ""
+        username = token.removeprefix("tok-") or "bench"
+        return web.json_response(
+            {
+                "user": {"userId": 1, "username": username},
+                "accountBalance": {"balance": {"amount": "0.0", "currency": "USD"}},
+            }
+        )
+
+
+def _serve(urls: multiprocessing.Queue, setup: Optional[Callable]) -> None:
+    async def run() -> None:
+        server = MockChargePoint()
+        if setup is not None:
+            setup(server)
+        async with server:
+            urls.put(server.base_url)
+            await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+@contextmanager
+def subprocess_server(
+    setup: Optional[Callable[[MockChargePoint], None]] = None,
+) -> Iterator[str]:
+    """
+    Run MockChargePoint in a child process and yield its base URL, keeping the
+    server's memory, sockets and CPU time out of the benchmark's measurements.
+    ``setup`` is called with the server before it starts, e.g. to add routes;
+    it must be picklable.
+    """
+    urls: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(urls, setup), daemon=True)
+    process.start()
+    try:
+        yield urls.get(timeout=30)
+    finally:
+        process.terminate()
+        process.join()
@@ -0,0 +1,107 @@
+"""
+Time-to-ack of session start commands under the old fixed ack polling and the
+default AckPollingStrategy.
+
+The mock API confirms each start command after a random delay, drawn uniformly
+from --min-delay to --max-delay seconds (seeded per device, so both strategies
+see the same delays). All commands run concurrently; each one is timed from
+sending startsession until its acknowledgement is confirmed.
+
+    python benchmarks/ack_polling.py --commands 200 --min-delay 0.2 --max-delay 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from functools import partial
+from typing import Dict, List
+
+from _server import MockChargePoint, StaticDiscoveryCache, global_config
+from _server import subprocess_server, token_for
+from aiohttp import web
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.metrics import Metrics
+from python_chargepoint.session import AckPollingStrategy, _send_command
+
+STRATEGIES = {
+    # Poll right away, then every 3 s, as before AckPollingStrategy existed.
+    "fixed 3s": AckPollingStrategy(
+        first_delay=3.0, multiplier=1.0, max_delay=3.0, timeout=None
+    ),
+    "default": AckPollingStrategy(),
+}
+
+
+def add_ack_routes(
+    seed: int, min_delay: float, max_delay: float, server: MockChargePoint
+) -> None:
+    endpoint = global_config("http://127.0.0.1").endpoints.accounts_endpoint.path
+    confirm_at: Dict[int, float] = {}
+
+    async def start(request: web.Request) -> web.Response:
+        device_id = (await request.json())["deviceId"]
+        delay = random.Random(seed * 1_000_003 + device_id).uniform(
+            min_delay, max_delay
+        )
+        confirm_at[device_id] = time.monotonic() + delay
+        return web.json_response({"ackId": device_id})
+
+    async def ack(request: web.Request) -> web.Response:
+        if time.monotonic() < confirm_at[(await request.json())["ackId"]]:
+            return web.json_response({"errorMessage": "pending"}, status=202)
+        return web.json_response({})
+
+    server.app.router.add_post(endpoint + "v1/driver/station/startsession", start)
+    server.app.router.add_post(endpoint + "v1/driver/station/session/ack", ack)
+
+
+async def measure(client: ChargePoint, commands: int) -> List[float]:
+    async def timed(device_id: int) -> float:
+        start = time.monotonic()
+        await _send_command(client, "start", device_id)
+        return time.monotonic() - start
+
+    return await asyncio.gather(*(timed(n) for n in range(1, commands + 1)))
+
+
+async def main(base_url: str, args: argparse.Namespace) -> None:
+    cache = StaticDiscoveryCache(global_config(base_url))
+    for name, strategy in STRATEGIES.items():
+        metrics = Metrics()
+        client = await ChargePoint.create(
+            "bench",
+            token_for("bench"),
+            discovery_cache=cache,
+            ack_polling=strategy,
+            metrics=metrics,
+        )
+        try:
+            times = sorted(await measure(client, args.commands))
+        finally:
+            await client.close()
+        polls = metrics.ack_attempts[("start", "confirmed")]
+        assert polls.count == args.commands
+        p95 = times[max(0, round(len(times) * 0.95) - 1)]
+        print(
+            f"{name:<9} mean {statistics.mean(times):5.2f}s  p95 {p95:5.2f}s"
+            f"  max {times[-1]:5.2f}s  {polls.mean:4.1f} polls/command"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--min-delay", type=float, default=0.2)
+    parser.add_argument("--max-delay", type=float, default=6.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    logging.getLogger("chargepoint").setLevel(logging.ERROR)
+    setup = partial(add_ack_routes, args.seed, args.min_delay, args.max_delay)
+    with subprocess_server(setup) as base_url:
+        asyncio.run(main(base_url, args))
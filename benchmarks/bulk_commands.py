@@ -0,0 +1,72 @@
+"""
+Wall-clock time to set the amperage limit on many home chargers, one at a time
+against bulk_set_amperage_limit() at several concurrency levels.
+
+The mock API answers every charge-amperage-limit PUT after --latency seconds,
+standing in for the round trip to ChargePoint and the charger.
+
+    python benchmarks/bulk_commands.py --chargers 500 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from functools import partial
+
+from _server import MockChargePoint, StaticDiscoveryCache, global_config
+from _server import subprocess_server, token_for
+from aiohttp import web
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.fleet import BulkCommandReport
+
+AMPERAGE_PATH = "api/v1/configuration/chargers/{charger_id}/charge-amperage-limit"
+
+
+def add_amperage_route(latency: float, server: MockChargePoint) -> None:
+    async def amperage(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({})
+
+    path = global_config("http://127.0.0.1").endpoints.hcpo_hcm_endpoint.path
+    server.app.router.add_put(path + AMPERAGE_PATH, amperage)
+
+
+async def main(base_url: str, args: argparse.Namespace) -> None:
+    cache = StaticDiscoveryCache(global_config(base_url))
+    client = await ChargePoint.create(
+        "bench", token_for("bench"), discovery_cache=cache
+    )
+    charger_ids = list(range(1, args.chargers + 1))
+    try:
+        start = time.perf_counter()
+        for charger_id in charger_ids:
+            await client.set_amperage_limit(charger_id, 16)
+        sequential = time.perf_counter() - start
+        print(f"{'sequential':<16} {sequential:7.2f}s")
+
+        for concurrency in args.concurrency:
+            report = await BulkCommandReport.collect(
+                client.bulk_set_amperage_limit(charger_ids, 16, concurrency=concurrency)
+            )
+            assert not report.failed, report.failed[0].error
+            print(
+                f"{f'bulk, {concurrency}':<16} {report.elapsed:7.2f}s"
+                f"  {sequential / report.elapsed:5.1f}x"
+            )
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--chargers", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 16, 64, 100])
+    args = parser.parse_args()
+    logging.getLogger("chargepoint").setLevel(logging.ERROR)
+    with subprocess_server(partial(add_amperage_route, args.latency)) as base_url:
+        asyncio.run(main(base_url, args))
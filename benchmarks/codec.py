@@ -0,0 +1,51 @@
+"""
+CPU cost of turning response bodies into models.
+
+Compares the three ways a body can be parsed:
+
+    stdlib dict   json.loads() then Model.model_validate(dict) (the old path)
+    orjson dict   OrjsonCodec.loads() then Model.model_validate(dict)
+    bytes         Model.model_validate_json(body), as the client now does
+
+for map responses of increasing size and for one station info response.
+
+    python benchmarks/codec.py --stations 10 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any, Callable, Dict
+
+from _payloads import map_response, per_call, station_info
+
+from python_chargepoint.codec import JSONCodec, OrjsonCodec
+from python_chargepoint.types import StationInfo, _MapResponse
+
+
+def paths(model: Any, body: bytes) -> Dict[str, Callable[[], Any]]:
+    stdlib, fast = JSONCodec(), OrjsonCodec()
+    return {
+        "stdlib dict": lambda: model.model_validate(stdlib.loads(body)),
+        "orjson dict": lambda: model.model_validate(fast.loads(body)),
+        "bytes": lambda: model.model_validate_json(body),
+    }
+
+
+def report(label: str, model: Any, body: bytes) -> None:
+    timings = {name: per_call(func) for name, func in paths(model, body).items()}
+    baseline = timings["stdlib dict"]
+    for name, seconds in timings.items():
+        print(
+            f"{label:<22} {name:<12} {seconds * 1e6:10.1f} us"
+            f"  {baseline / seconds:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--stations", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+    for count in args.stations:
+        report(f"map, {count} stations", _MapResponse, map_response(count))
+    report("station info", StationInfo, station_info())
@@ -0,0 +1,104 @@
+"""
+Memory held per MapStation and StationInfo with set_extra_fields("allow")
+against set_extra_fields("ignore").
+
+The example payloads in tests/example only contain declared fields, so each
+station (and each of its ports) gets the undeclared fields below added. They
+stand in for the fields the live API sends that the models do not declare.
+Every object is parsed from its own body, as the client does, and kept alive
+while tracemalloc measures it.
+
+    python benchmarks/extra_fields.py --objects 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Dict, List
+
+from _payloads import example, map_stations
+
+from python_chargepoint.types import MapStation, StationInfo, set_extra_fields
+
+MAP_EXTRAS: Dict[str, Any] = {
+    "address2": "Suite 100",
+    "state": "Teststate",
+    "zipcode": "12345",
+    "country": "US",
+    "station_power_shed_status": "NONE",
+    "reservable": False,
+    "is_favorite": False,
+    "image_url": "https://example.com/station.jpg",
+    "subscriptions": [],
+    "pricing_info": {"currency": "USD", "min_price": 0.1, "max_price": 0.3},
+}
+MAP_PORT_EXTRAS: Dict[str, Any] = {
+    "port_power_shed_status": "NONE",
+    "is_reserved": False,
+    "display_plug_type": "J1772",
+}
+INFO_EXTRAS: Dict[str, Any] = {
+    "stationAmenities": ["restroom", "wifi"],
+    "imageUrls": ["https://example.com/station.jpg"],
+    "reservable": False,
+    "powerShedStatus": "NONE",
+    "openingHours": {"monday": "00:00-24:00", "sunday": "00:00-24:00"},
+    "companyId": 1,
+    "lastModified": 1767225600000,
+}
+
+
+def map_bodies(count: int) -> List[bytes]:
+    bodies = []
+    for station in map_stations(count):
+        station.update(MAP_EXTRAS)
+        for port in station["ports"]:
+            port.update(MAP_PORT_EXTRAS)
+        bodies.append(json.dumps(station).encode())
+    return bodies
+
+
+def info_bodies(count: int) -> List[bytes]:
+    bodies = []
+    for n in range(count):
+        info = example("station_info")
+        info["deviceId"] = 10_000_000 + n
+        info.update(INFO_EXTRAS)
+        bodies.append(json.dumps(info).encode())
+    return bodies
+
+
+def bytes_per_object(model: Any, bodies: List[bytes]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    objects = [model.model_validate_json(body) for body in bodies]
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del objects
+    return used / len(bodies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--objects", type=int, default=10_000)
+    args = parser.parse_args()
+    payloads = {
+        "MapStation": (MapStation, map_bodies(args.objects)),
+        "StationInfo": (StationInfo, info_bodies(args.objects)),
+    }
+    for name, (model, bodies) in payloads.items():
+        results = {}
+        for mode in ("allow", "ignore"):
+            set_extra_fields(mode)
+            results[mode] = bytes_per_object(model, bodies)
+        saved = 1 - results["ignore"] / results["allow"]
+        print(
+            f"{name:<12} allow {results['allow']:8,.0f} B"
+            f"  ignore {results['ignore']:8,.0f} B  {saved:6.1%} less"
+        )
+    set_extra_fields("allow")
@@ -0,0 +1,113 @@
+"""
+Memory and socket usage of ChargePointPool against standalone clients.
+
+For each account count, every account is created and used once (create()
+loads the account profile). Standalone clients each own a ClientSession and
+cookie jar, as ChargePoint.create() does without a session; the pool shares
+one session and connector between all accounts. The mock API runs in a child
+process, so only client-side memory (tracemalloc) and sockets are counted.
+
+    python benchmarks/pool_accounts.py --accounts 1000 10000 --modes pool standalone
+
+Standalone mode keeps one socket per account open, so large counts need a high
+open-file limit (ulimit -n). Socket counts need Linux's /proc.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import logging
+import time
+import tracemalloc
+from typing import Awaitable, Callable, List
+
+from _server import StaticDiscoveryCache, global_config, open_sockets
+from _server import subprocess_server, token_for
+
+from python_chargepoint import ChargePoint, ChargePointPool
+
+
+async def _bounded(jobs: List[Callable[[], Awaitable[None]]], limit: int = 100):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(job):
+        async with semaphore:
+            await job()
+
+    await asyncio.gather(*(run(job) for job in jobs))
+
+
+async def _pool(cache: StaticDiscoveryCache, usernames: List[str]) -> Callable:
+    pool = ChargePointPool(limit=100, discovery_cache=cache)
+    for username in usernames:
+        pool.add_account(username, coulomb_token=token_for(username))
+
+    async def borrow(username: str) -> None:
+        async with pool.client(username):
+            pass
+
+    await _bounded([lambda u=u: borrow(u) for u in usernames])
+    return pool.close
+
+
+async def _standalone(cache: StaticDiscoveryCache, usernames: List[str]) -> Callable:
+    clients: List[ChargePoint] = []
+
+    async def create(username: str) -> None:
+        clients.append(
+            await ChargePoint.create(
+                username, token_for(username), discovery_cache=cache
+            )
+        )
+
+    await _bounded([lambda u=u: create(u) for u in usernames])
+
+    async def close() -> None:
+        await asyncio.gather(*(client.close() for client in clients))
+
+    return close
+
+
+async def measure(base_url: str, mode: str, accounts: int) -> None:
+    usernames = [f"user{n:05d}" for n in range(accounts)]
+    cache = StaticDiscoveryCache(global_config(base_url))
+    gc.collect()
+    sockets = open_sockets()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    close = await (_pool if mode == "pool" else _standalone)(cache, usernames)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    sockets = open_sockets() - sockets
+    await close()
+    print(
+        f"{mode:<10} {accounts:>7} accounts  {used / 2**20:8.1f} MiB"
+        f"  {used / accounts / 1024:6.1f} KiB/account"
+        f"  {sockets:>6} open sockets  {elapsed:6.1f}s"
+    )
+
+
+async def main(base_url: str, args: argparse.Namespace) -> None:
+    for accounts in args.accounts:
+        for mode in args.modes:
+            await measure(base_url, mode, accounts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--accounts", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["pool", "standalone"],
+        default=["pool", "standalone"],
+    )
+    args = parser.parse_args()
+    logging.getLogger("chargepoint").setLevel(logging.ERROR)
+    with subprocess_server() as base_url:
+        asyncio.run(main(base_url, args))
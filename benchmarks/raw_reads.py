@@ -0,0 +1,67 @@
+"""
+Throughput of validated reads against raw=True reads.
+
+Each read starts from a response body and does what the client does with it:
+
+    validated   get_nearby_stations(), get_station(), get_charging_session()
+    raw         the same calls with raw=True, which only decode the body
+
+Map responses hold --stations stations and the charging session holds --points
+update_data readings (an hour of ten-second readings by default).
+
+    python benchmarks/raw_reads.py --stations 1000 --points 360
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any, Callable, Dict, Tuple
+
+from _payloads import charging_status, map_response, per_call, station_info
+
+from python_chargepoint.codec import default_codec
+from python_chargepoint.session import ChargingSession
+from python_chargepoint.types import StationInfo, _MapResponse
+
+codec = default_codec()
+
+
+def reads(
+    stations: int, points: int
+) -> Dict[str, Tuple[int, Callable[[], Any], Callable[[], Any]]]:
+    """name -> (objects per read, validated read, raw read)"""
+    map_body = map_response(stations)
+    info_body = station_info()
+    status_body = charging_status(points)
+    return {
+        "map stations": (
+            stations,
+            lambda: _MapResponse.model_validate_json(map_body).map_data.stations,
+            lambda: codec.loads(map_body)["map_data"]["stations"],
+        ),
+        "station info": (
+            1,
+            lambda: StationInfo.model_validate_json(info_body),
+            lambda: codec.loads(info_body),
+        ),
+        "charging session": (
+            1,
+            lambda: ChargingSession.from_status(
+                1, codec.loads(status_body)["charging_status"]
+            ),
+            lambda: codec.loads(status_body)["charging_status"],
+        ),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--stations", type=int, default=1000)
+    parser.add_argument("--points", type=int, default=360)
+    args = parser.parse_args()
+    for name, (objects, validated, raw) in reads(args.stations, args.points).items():
+        slow, fast = per_call(validated), per_call(raw)
+        print(
+            f"{name:<17} validated {objects / slow:12,.0f}/s"
+            f"  raw {objects / fast:12,.0f}/s  {slow / fast:6.1f}x"
+        )
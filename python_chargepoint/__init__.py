@@ -1 +1,2 @@
 from .client import ChargePoint  # noqa: F401
+from .pool import ChargePointPool  # noqa: F401
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from .constants import _LOGGER
+from .global_config import GlobalConfiguration
+from .types import MapStation, StationInfo
+
+_DEFAULT_DISCOVERY_TTL = 7 * 24 * 3600
+_DEFAULT_DISCOVERY_REVALIDATE_AFTER = 24 * 3600
+_DEFAULT_STATION_STATIC_TTL = 24 * 3600
+_DEFAULT_STATION_STATUS_TTL = 30
+
+
+@dataclass
+class DiscoveryCacheEntry:
+    config: GlobalConfiguration
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class DiscoveryCache(ABC):
+    """
+    Base class for persistent stores of discovered GlobalConfiguration objects.
+
+    Entries younger than ``ttl`` seconds are used by ChargePoint.create() in
+    place of a discovery request. Entries older than ``revalidate_after``
+    seconds are still used, but are refreshed by a background request.
+    Subclasses implement ``_read`` and ``_write``.
+    """
+
+    def __init__(
+        self,
+        ttl: float = _DEFAULT_DISCOVERY_TTL,
+        revalidate_after: float = _DEFAULT_DISCOVERY_REVALIDATE_AFTER,
+    ):
+        self.ttl = ttl
+        self.revalidate_after = revalidate_after
+
+    @staticmethod
+    def _key(username: str) -> str:
+        return username.strip().lower()
+
+    def get(self, username: str) -> Optional[DiscoveryCacheEntry]:
+        try:
+            stored = self._read(self._key(username))
+        except (OSError, sqlite3.Error) as exc:
+            _LOGGER.warning("Failed to read discovery cache: %s", exc)
+            return None
+        if stored is None:
+            return None
+
+        payload, stored_at = stored
+        try:
+            config = GlobalConfiguration.model_validate_json(payload)
+        except ValidationError:
+            _LOGGER.warning("Ignoring corrupt discovery cache entry for %s", username)
+            return None
+        return DiscoveryCacheEntry(config=config, stored_at=stored_at)
+
+    def set(self, username: str, config: GlobalConfiguration) -> None:
+        payload = config.model_dump_json(by_alias=True)
+        try:
+            self._write(self._key(username), payload, time.time())
+        except (OSError, sqlite3.Error) as exc:
+            _LOGGER.warning("Failed to write discovery cache: %s", exc)
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return the stored payload and its timestamp, or None."""
+
+    @abstractmethod
+    def _write(self, key: str, payload: str, stored_at: float) -> None:
+        """Store a payload, replacing any existing entry for ``key``."""
+
+
+class FileDiscoveryCache(DiscoveryCache):
+    """Stores one JSON document per username in ``directory``."""
+
+    def __init__(self, directory: Union[str, Path], **kwargs):
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def _read(self, key: str) -> Optional[Tuple[str, float]]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            document = json.loads(path.read_text())
+            return document["config"], float(document["stored_at"])
+        except (ValueError, KeyError, TypeError):
+            _LOGGER.warning("Ignoring unreadable discovery cache file %s", path)
+            return None
+
+    def _write(self, key: str, payload: str, stored_at: float) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        document = json.dumps({"stored_at": stored_at, "config": payload})
+        # Write to a temporary file and rename it so concurrent readers never
+        # observe a partially written entry.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(document)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+class SQLiteDiscoveryCache(DiscoveryCache):
+    """Stores entries in a single SQLite database file at ``path``."""
+
+    def __init__(self, path: Union[str, Path], **kwargs):
+        super().__init__(**kwargs)
+        self.path = str(path)
+        with closing(sqlite3.connect(self.path)) as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS discovery "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+
+    def _read(self, key: str) -> Optional[Tuple[str, float]]:
+        with closing(sqlite3.connect(self.path)) as db:
+            row = db.execute(
+                "SELECT payload, stored_at FROM discovery WHERE key = ?", (key,)
+            ).fetchone()
+        return (row[0], float(row[1])) if row else None
+
+    def _write(self, key: str, payload: str, stored_at: float) -> None:
+        with closing(sqlite3.connect(self.path)) as db, db:
+            db.execute(
+                "INSERT OR REPLACE INTO discovery (key, stored_at, payload) "
+                "VALUES (?, ?, ?)",
+                (key, stored_at, payload),
+            )
+
+
+@dataclass
+class StationCacheStats:
+    hits: int = 0
+    status_refreshes: int = 0
+    misses: int = 0
+
+
+@dataclass
+class _StationCacheEntry:
+    info: StationInfo
+    fetched_at: float
+    status_at: float
+
+
+class StationCache:
+    """
+    Bounded, in-memory LRU cache of StationInfo used by ChargePoint.get_station().
+
+    Static metadata (address, network, pricing, model, ...) is kept for
+    ``static_ttl`` seconds. Status fields (station and port status) are only
+    trusted for ``status_ttl`` seconds; after that the client refreshes them
+    from the map API instead of downloading the full station info again.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        static_ttl: float = _DEFAULT_STATION_STATIC_TTL,
+        status_ttl: float = _DEFAULT_STATION_STATUS_TTL,
+    ):
+        self.max_size = max_size
+        self.static_ttl = static_ttl
+        self.status_ttl = status_ttl
+        self.stats = StationCacheStats()
+        self._entries: OrderedDict[int, _StationCacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, device_id: int) -> Optional[_StationCacheEntry]:
+        entry = self._entries.get(device_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.fetched_at >= self.static_ttl:
+            del self._entries[device_id]
+            return None
+        self._entries.move_to_end(device_id)
+        return entry
+
+    def status_fresh(self, entry: _StationCacheEntry) -> bool:
+        return time.monotonic() - entry.status_at < self.status_ttl
+
+    def put(self, info: StationInfo) -> None:
+        now = time.monotonic()
+        self._entries[info.device_id] = _StationCacheEntry(info, now, now)
+        self._entries.move_to_end(info.device_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def update_status(self, entry: _StationCacheEntry, station: MapStation) -> None:
+        """Merge the status fields of a map result into a cached entry."""
+        port_status = {p.outlet_number: p for p in station.ports}
+        ports = [
+            (
+                port.model_copy(
+                    update={
+                        "status": port_status[port.outlet_number].status,
+                        "status_v2": port_status[port.outlet_number].status_v2,
+                    }
+                )
+                if port.outlet_number in port_status
+                else port
+            )
+            for port in entry.info.ports_info.ports
+        ]
+        entry.info = entry.info.model_copy(
+            update={
+                "station_status": station.station_status,
+                "station_status_v2": station.station_status_v2,
+                "ports_info": entry.info.ports_info.model_copy(update={"ports": ports}),
+            }
+        )
+        entry.status_at = time.monotonic()
+
+    def invalidate(self, device_id: Optional[int] = None) -> None:
+        if device_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(device_id, None)
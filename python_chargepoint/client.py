@@ -1,7 +1,27 @@
 from __future__ import annotations
 
-from typing import List, Optional
-from functools import wraps
+import asyncio
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+    overload,
+)
+from functools import partial, wraps
 from importlib.metadata import version, PackageNotFoundError
 from urllib.parse import unquote
 from http.cookies import SimpleCookie
@@ -20,15 +40,37 @@ from .types import (
     MapStation,
     StationInfo,
     UserChargingStatus,
+    _MapResponse,
+    _map_response,
+    projection,
 )
+from pydantic import BaseModel, TypeAdapter
+
+from .cache import DiscoveryCache, StationCache
+from .codec import JSONCodec, default_codec
 from .global_config import GlobalConfiguration, ZoomBounds
+from .fleet import (
+    CommandResult,
+    HomeChargerSnapshot,
+    _collect_snapshots,
+    _run_bulk,
+)
 from .exceptions import (
+    APIError,
     LoginError,
     CommunicationError,
     InvalidSession,
     DatadomeCaptcha,
 )
-from .session import ChargingSession
+from .deadline import deadline
+from .instrumentation import Instrumentation, operation
+from .metrics import Metrics
+from .tracing import set_response_status, span
+from .ratelimit import RateLimiter
+from .retry import CircuitBreakers, RetryPolicy
+from .session import AckPollingStrategy, ChargingSession, PendingChargingSession
+from .singleflight import SingleFlight, SingleFlightStats
+from .token_store import TokenStore
 from .constants import _LOGGER, DISCOVERY_API
 from . import __name__ as MODULE_NAME
 
@@ -42,37 +84,167 @@ COULOMB_SESSION = "coulomb_sess"
 SSO_SESSION = "auth-session"
 COOKIE_DOMAIN = ".chargepoint.com"
 _COULOMB_SESSION_MAX_AGE = 10 * 365 * 24 * 3600
+_STATE_VERSION = 1
+_VEHICLE_LIST = TypeAdapter(List[ElectricVehicle])
+
+T = TypeVar("T")
+
+ReloginCallback = Callable[["ChargePoint"], Awaitable[None]]
+_REAUTHENTICATING: ContextVar[bool] = ContextVar(
+    "python_chargepoint_reauthenticating", default=False
+)
+
 
+def _require_login(func=None, *, replay: bool = True):
+    """
+    Require a session token. With a relogin callback, a call failing with
+    InvalidSession logs in again (once per client, see _reauthenticate) and
+    is retried once. Calls that must not run twice, such as starting a
+    session, use ``@_require_login(replay=False)`` and rely on their requests
+    being retried individually with _with_relogin().
+    """
+    if func is None:
+        return partial(_require_login, replay=replay)
 
-def _require_login(func):
     @wraps(func)
     async def check_login(*args, **kwargs):
         self: ChargePoint = args[0]
         if self.coulomb_token is None:
             raise RuntimeError("Must login to use ChargePoint API")
-        return await func(*args, **kwargs)
+        if not replay:
+            return await func(*args, **kwargs)
+        return await self._with_relogin(lambda: func(*args, **kwargs))
 
     return check_login
 
 
+def _api_call(func):
+    """
+    Entry point for public coroutines. Accepts a keyword-only ``timeout`` (in
+    seconds, defaulting to the client's timeout) that bounds the whole call,
+    including nested requests and polling, and raises DeadlineExceeded.
+    Timings recorded during the call are labelled with the method name, and
+    the call is traced as a ``ChargePoint.<method>`` span.
+    """
+
+    @wraps(func)
+    async def call(self: ChargePoint, *args, timeout: Optional[float] = None, **kwargs):
+        with operation(func.__name__), span(f"ChargePoint.{func.__name__}"):
+            with self._timed("total"):
+                async with deadline(timeout if timeout is not None else self._timeout):
+                    return await func(self, *args, **kwargs)
+
+    return call
+
+
+def _freeze(value):
+    if isinstance(value, BaseModel):
+        return type(value).__name__, value.model_dump_json()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type(value).__name__, tuple(_freeze(v) for v in value)
+    return value
+
+
+def _idempotent(func):
+    """
+    Mark a read-only API method: concurrent identical calls on one client are
+    coalesced into a single request, which is retried per the client's RetryPolicy.
+    """
+
+    @wraps(func)
+    async def coalesce(self: ChargePoint, *args, **kwargs):
+        key = (
+            func.__name__,
+            tuple(_freeze(a) for a in args),
+            tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())),
+        )
+
+        def call():
+            if self._retry_policy is None:
+                return func(self, *args, **kwargs)
+            return self._retry_policy.run(lambda: func(self, *args, **kwargs))
+
+        try:
+            hash(key)
+        except TypeError:
+            return await call()
+        return await self._single_flight.do(key, call)
+
+    return coalesce
+
+
 class ChargePoint:
     def __init__(
         self,
         username: str,
         coulomb_token: str = "",
         session: Optional[aiohttp.ClientSession] = None,
+        discovery_cache: Optional[DiscoveryCache] = None,
+        use_cookie_jar: bool = True,
+        station_cache: Optional[StationCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        timeout: Optional[float] = None,
+        codec: Optional[JSONCodec] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        metrics: Optional[Metrics] = None,
+        token_store: Optional[TokenStore] = None,
+        keepalive_interval: Optional[float] = None,
+        relogin: Optional[ReloginCallback] = None,
+        ack_polling: Optional[AckPollingStrategy] = None,
     ):
         self._username = username
         self._user_id: Optional[int] = None
         self._global_config: GlobalConfiguration
         self._request_headers = {"user-agent": USER_AGENT}
         self._owns_session = session is None
+        self._discovery_cache = discovery_cache
+        self._station_cache = station_cache
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._circuit_breakers = circuit_breakers
+        self._timeout = timeout
+        self._codec = codec or default_codec()
+        self._instrumentation = instrumentation
+        self._metrics = metrics
+        self._token_store = token_store
+        # Tokens are stored under the username the client was created with, even
+        # if the account reports a different spelling.
+        self._token_store_key = username
+        self._stored_token: Optional[str] = None
+        self._keepalive_interval = keepalive_interval
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._relogin = relogin
+        self._ack_polling = ack_polling or AckPollingStrategy()
+        self._reauth_lock = asyncio.Lock()
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._single_flight = SingleFlight()
+        if metrics is not None:
+            metrics.track_single_flight(self._single_flight)
+            if station_cache is not None:
+                metrics.track_station_cache(station_cache)
+        # Without a cookie jar the token lives in a plain attribute and is sent
+        # as a prebuilt Cookie header.
+        self._use_cookie_jar = use_cookie_jar
+        self._coulomb_token: Optional[str] = None
+        self._cookie_header = ""
 
         if session is not None:
             self._session = session
         else:
-            self._session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar())
+            self._session = aiohttp.ClientSession(
+                cookie_jar=(
+                    aiohttp.CookieJar() if use_cookie_jar else aiohttp.DummyCookieJar()
+                ),
+                trace_configs=(
+                    [instrumentation.trace_config()] if instrumentation else None
+                ),
+            )
 
+        if not coulomb_token and token_store is not None:
+            self._stored_token = token_store.get(username)
+            coulomb_token = self._stored_token or ""
         if coulomb_token:
             self._set_coulomb_token(coulomb_token)
 
@@ -82,14 +254,111 @@ class ChargePoint:
         username: str,
         coulomb_token: str = "",
         session: Optional[aiohttp.ClientSession] = None,
+        discovery_cache: Optional[DiscoveryCache] = None,
+        use_cookie_jar: bool = True,
+        station_cache: Optional[StationCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        timeout: Optional[float] = None,
+        codec: Optional[JSONCodec] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        metrics: Optional[Metrics] = None,
+        token_store: Optional[TokenStore] = None,
+        keepalive_interval: Optional[float] = None,
+        relogin: Optional[ReloginCallback] = None,
+        ack_polling: Optional[AckPollingStrategy] = None,
     ) -> ChargePoint:
-        client = cls(username, coulomb_token, session)
-        client._global_config = await client._get_configuration(username)
-        if coulomb_token:
-            await client._init_account_parameters()
+        """
+        Discover the account's region and, given a session token, load the
+        account. Without a token, a token_store may provide one; a stored token
+        the API rejects is dropped, leaving the client logged out.
+        """
+        client = cls(
+            username,
+            coulomb_token,
+            session,
+            discovery_cache=discovery_cache,
+            use_cookie_jar=use_cookie_jar,
+            station_cache=station_cache,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            timeout=timeout,
+            codec=codec,
+            instrumentation=instrumentation,
+            metrics=metrics,
+            token_store=token_store,
+            keepalive_interval=keepalive_interval,
+            relogin=relogin,
+            ack_polling=ack_polling,
+        )
+        from_store = not coulomb_token and client._stored_token is not None
+        try:
+            async with deadline(timeout):
+                client._global_config = await client._get_configuration(username)
+                if client.coulomb_token:
+                    try:
+                        await client._init_account_parameters()
+                    except InvalidSession:
+                        if not from_store:
+                            raise
+                        _LOGGER.info("Stored session token for %s expired", username)
+                        client._clear_coulomb_token()
+        except BaseException:
+            await client.close()
+            raise
+        return client
+
+    def to_state(self) -> dict:
+        """
+        Snapshot an initialised client as a JSON-serializable dict.
+
+        The snapshot contains the session token; store it as you would a password.
+        """
+        token = self.coulomb_token
+        if token is None:
+            raise RuntimeError("Must login before taking a client snapshot")
+        return {
+            "v": _STATE_VERSION,
+            "username": self._username,
+            "user_id": self._user_id,
+            "coulomb_token": token,
+            "headers": {
+                k: v for k, v in self._request_headers.items() if k != "user-agent"
+            },
+            "global_config": self._global_config.model_dump(mode="json", by_alias=True),
+        }
+
+    @classmethod
+    def from_state(
+        cls,
+        state: dict,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs,
+    ) -> ChargePoint:
+        """
+        Rebuild a client from a to_state() snapshot without any network calls.
+        Additional keyword arguments are passed to the constructor. With a
+        keepalive_interval, call this from a running event loop; the keepalive
+        starts right away.
+        """
+        if state.get("v") != _STATE_VERSION:
+            raise ValueError(f"Unsupported client state version: {state.get('v')}")
+        client = cls(state["username"], state["coulomb_token"], session, **kwargs)
+        client._global_config = GlobalConfiguration.model_validate(
+            state["global_config"]
+        )
+        client._user_id = state["user_id"]
+        client._request_headers.update(state["headers"])
+        client._start_keepalive()
         return client
 
     async def close(self) -> None:
+        for task in self._background_tasks:
+            task.cancel()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
         if self._owns_session:
             await self._session.close()
 
@@ -101,8 +370,15 @@ class ChargePoint:
     def session(self) -> aiohttp.ClientSession:
         return self._session
 
+    @property
+    def single_flight_stats(self) -> SingleFlightStats:
+        """Counts of read calls made and of those served by an in-flight request."""
+        return self._single_flight.stats
+
     @property
     def coulomb_token(self) -> Optional[str]:
+        if not self._use_cookie_jar:
+            return self._coulomb_token
         cookies = self._session.cookie_jar.filter_cookies(
             URL(f"https://account{COOKIE_DOMAIN}/")
         )
@@ -112,6 +388,11 @@ class ChargePoint:
     def _set_coulomb_token(self, token: str):
         if token:
             parsed = unquote(token)
+            self._save_coulomb_token(parsed)
+            if not self._use_cookie_jar:
+                if parsed != self._coulomb_token:
+                    self._store_coulomb_token(parsed)
+                return
             cookie: SimpleCookie = SimpleCookie()
             cookie[COULOMB_SESSION] = parsed
             cookie[COULOMB_SESSION]["domain"] = COOKIE_DOMAIN
@@ -120,20 +401,101 @@ class ChargePoint:
             self._session.cookie_jar.update_cookies(
                 cookie, response_url=URL(f"https://account{COOKIE_DOMAIN}/")
             )
+            if "cp-session-token" in self._request_headers:
+                self._request_headers["cp-session-token"] = parsed
         else:
             raise ValueError("empty session token provided")
 
+    def _clear_coulomb_token(self) -> None:
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        self._session.cookie_jar.clear()
+        self._coulomb_token = None
+        self._cookie_header = ""
+        self._user_id = None
+
+    def _save_coulomb_token(self, token: str) -> None:
+        """Write a new token to the token store, skipping unchanged tokens."""
+        if self._token_store is not None and token != self._stored_token:
+            self._token_store.set(self._token_store_key, token)
+            self._stored_token = token
+
+    def _store_coulomb_token(self, token: str) -> None:
+        cookie: SimpleCookie = SimpleCookie()
+        cookie[COULOMB_SESSION] = token
+        self._coulomb_token = token
+        self._cookie_header = f"{COULOMB_SESSION}={cookie[COULOMB_SESSION].coded_value}"
+        if "cp-session-token" in self._request_headers:
+            self._request_headers["cp-session-token"] = token
+
     @property
     def global_config(self) -> GlobalConfiguration:
         return self._global_config
 
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        """Run a coroutine in the background until it finishes or close() is called."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     async def _request(self, method: str, url: URL, **kwargs) -> aiohttp.ClientResponse:
         _LOGGER.debug("[%s] %s", method, url)
         headers = {**self._request_headers, **kwargs.pop("headers", {})}
-        response = await self._session.request(method, url, headers=headers, **kwargs)
+        if "json" in kwargs:
+            kwargs["data"] = self._codec.dumps(kwargs.pop("json"))
+            headers.setdefault("Content-Type", "application/json")
+        if self._cookie_header:
+            headers.setdefault("Cookie", self._cookie_header)
+        host = url.host or ""
+        breaker = (
+            self._circuit_breakers.for_host(host)
+            if self._circuit_breakers is not None
+            else None
+        )
+        if breaker is not None:
+            breaker.before_request()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(host)
+        if self._metrics is not None:
+            self._metrics.request_started(host)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            with span(
+                f"HTTP {method}",
+                {
+                    "http.request.method": method,
+                    "server.address": host,
+                    "url.path": url.path,
+                },
+            ) as current:
+                response = await self._session.request(
+                    method, url, headers=headers, **kwargs
+                )
+                set_response_status(current, response.status)
+            status = str(response.status)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        finally:
+            if self._metrics is not None:
+                self._metrics.request_finished(
+                    host, status, time.perf_counter() - started
+                )
+        if breaker is not None:
+            if response.status >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        if self._rate_limiter is not None:
+            self._rate_limiter.record(host, response.status)
 
         # ChargePoint servers return coulomb_sess with Max-Age=7200 on every response.
-        # Re-set it without expiry so the cookie jar never evicts it.
+        # Re-set it without expiry so the cookie jar never evicts it. Without a
+        # cookie jar this only does work when the token value actually changes.
         refreshed = response.cookies.get(COULOMB_SESSION)
         if refreshed and refreshed.value:
             self._set_coulomb_token(refreshed.value)
@@ -144,13 +506,17 @@ class ChargePoint:
 
         if response.status == 401:
             await response.release()
+            if self._metrics is not None:
+                self._metrics.record_error("invalid_session")
             raise InvalidSession(
                 response, "Session token has expired. Please login again!"
             )
         if response.status == 403:
             try:
-                body = await response.json(content_type=None)
+                body = await self._read_json(response)
                 if "url" in body:
+                    if self._metrics is not None:
+                        self._metrics.record_error("datadome_captcha")
                     raise DatadomeCaptcha(
                         body["url"], f"[{method}] {url} blocked by Datadome."
                     )
@@ -160,6 +526,44 @@ class ChargePoint:
 
         return response
 
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        return self._instrumentation
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        return self._metrics
+
+    @property
+    def ack_polling(self) -> AckPollingStrategy:
+        return self._ack_polling
+
+    def _timed(self, phase: str) -> ContextManager[None]:
+        if self._instrumentation is None:
+            return nullcontext()
+        return self._instrumentation.timer(phase)
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        with self._timed("read"):
+            return await response.read()
+
+    async def _read_json(self, response: aiohttp.ClientResponse) -> Any:
+        body = await self._read_body(response)
+        with self._timed("decode"):
+            return self._codec.loads(body)
+
+    async def _read_model(
+        self, response: aiohttp.ClientResponse, validate: Callable[[bytes], T]
+    ) -> T:
+        """Validate a response body straight from bytes, e.g. with model_validate_json."""
+        body = await self._read_body(response)
+        with self._timed("validate"):
+            return validate(body)
+
+    def _validate(self, validate: Callable[[Any], T], data: Any) -> T:
+        with self._timed("validate"):
+            return validate(data)
+
     async def _raise_for_status(
         self, response: aiohttp.ClientResponse, message: str
     ) -> None:
@@ -175,6 +579,7 @@ class ChargePoint:
     async def _init_account_parameters(self):
         account: Account = await self.get_account()
         self._user_id = account.user.user_id
+
         if account.user.username != self._username:
             _LOGGER.warning(
                 "Username used for discovery (%s) does not match session (%s), using value from session.",
@@ -190,7 +595,75 @@ class ChargePoint:
                 "cp-region": self._global_config.region,
             }
         )
+        self._start_keepalive()
+
+    def _start_keepalive(self) -> None:
+        if self._keepalive_interval and self._keepalive_task is None:
+            self._keepalive_task = self._spawn(self._keepalive())
+
+    def _adopt_shared_token(self) -> bool:
+        """Switch to the token store's token if another process replaced ours."""
+        if self._token_store is None:
+            return False
+        shared = self._token_store.get(self._token_store_key)
+        if not shared or shared == self.coulomb_token:
+            return False
+        _LOGGER.debug("Adopting session token from the token store")
+        self._stored_token = shared
+        self._set_coulomb_token(shared)
+        return True
+
+    async def _reauthenticate(self, stale_token: str) -> None:
+        """
+        Replace an expired session token. Concurrent callers queue on a lock;
+        whoever gets it after the token has already changed returns without
+        logging in again. A newer token in the token store is adopted before
+        falling back to the relogin callback.
+        """
+        assert self._relogin is not None
+        async with self._reauth_lock:
+            if self.coulomb_token != stale_token:
+                return
+            if self._adopt_shared_token():
+                return
+            _LOGGER.info("Session token expired, logging in again")
+            reauthenticating = _REAUTHENTICATING.set(True)
+            try:
+                await self._relogin(self)
+            finally:
+                _REAUTHENTICATING.reset(reauthenticating)
 
+    async def _with_relogin(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``call()``; if it fails with InvalidSession and the client has a
+        relogin callback, replace the token and await it once more.
+        """
+        token = self.coulomb_token
+        try:
+            return await call()
+        except InvalidSession:
+            if self._relogin is None or token is None or _REAUTHENTICATING.get():
+                raise
+            await self._reauthenticate(token)
+        return await call()
+
+    async def _keepalive(self) -> None:
+        """
+        Touch the session every keepalive_interval seconds so it does not expire
+        without user traffic, first adopting any newer token another process
+        wrote to the token store. Failures are logged and retried on the next
+        tick; only cancellation (close()) stops the loop.
+        """
+        assert self._keepalive_interval is not None
+        while True:
+            await asyncio.sleep(self._keepalive_interval)
+            try:
+                self._adopt_shared_token()
+                await self.get_account()
+            except Exception as exc:
+                _LOGGER.warning("Session keepalive failed: %r", exc)
+
+    @_api_call
     async def login_with_password(self, password: str) -> None:
         """
         Login to ChargePoint with a username and password.
@@ -213,7 +686,7 @@ class ChargePoint:
 
             if login.status == 403:
                 try:
-                    body = await login.json(content_type=None)
+                    body = await self._read_json(login)
                     if "url" in body:
                         raise DatadomeCaptcha(
                             body["url"], "Login blocked by Datadome captcha."
@@ -230,6 +703,7 @@ class ChargePoint:
             )
             raise LoginError(login, "Failed to authenticate to ChargePoint!")
 
+    @_api_call
     async def login_with_sso_session(self, sso_jwt: str) -> None:
         _LOGGER.debug("Requesting coulomb session token")
         url = (
@@ -247,6 +721,7 @@ class ChargePoint:
                 response, "Failed to exchange sso auth token for coulomb session."
             )
 
+    @_api_call
     async def logout(self) -> None:
         response = await self._request(
             "POST",
@@ -255,17 +730,51 @@ class ChargePoint:
 
         await self._raise_for_status(response, "Failed to log out!")
         await response.release()
-        self._session.cookie_jar.clear()
-        self._user_id = None
+        self._clear_coulomb_token()
+        if self._token_store is not None:
+            self._token_store.delete(self._token_store_key)
+            self._stored_token = None
 
     async def _get_configuration(self, username: str) -> GlobalConfiguration:
+        cache = self._discovery_cache
+        if cache is None:
+            return await self._discover_configuration(username)
+
+        entry = cache.get(username)
+        if entry is not None and entry.age < cache.ttl:
+            _LOGGER.debug(
+                "Using cached global configuration for %s (age %.0fs)",
+                username,
+                entry.age,
+            )
+            if entry.age >= cache.revalidate_after:
+                self._spawn(self._revalidate_configuration(username))
+            return entry.config
+
+        config = await self._discover_configuration(username)
+        cache.set(username, config)
+        return config
+
+    async def _revalidate_configuration(self, username: str) -> None:
+        assert self._discovery_cache is not None
+        try:
+            config = await self._discover_configuration(username)
+        except (APIError, aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            _LOGGER.warning("Background discovery revalidation failed: %r", exc)
+            return
+        self._discovery_cache.set(username, config)
+        self._global_config = config
+
+    async def _discover_configuration(self, username: str) -> GlobalConfiguration:
         _LOGGER.debug("Discovering account region for username %s", username)
         request = {"username": username}
         response = await self._request("POST", DISCOVERY_API, json=request)
         await self._raise_for_status(
             response, "Failed to discover region for provided username!"
         )
-        config = GlobalConfiguration.model_validate(await response.json())
+        config = await self._read_model(
+            response, GlobalConfiguration.model_validate_json
+        )
         _LOGGER.debug(
             "Discovered account region: %s / %s (%s)",
             config.region,
@@ -274,7 +783,9 @@ class ChargePoint:
         )
         return config
 
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_account(self) -> Account:
         _LOGGER.debug("Getting ChargePoint Account Details")
         response = await self._request(
@@ -283,9 +794,11 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to get user information.")
-        return Account.model_validate(await response.json())
+        return await self._read_model(response, Account.model_validate_json)
 
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_vehicles(self) -> List[ElectricVehicle]:
         _LOGGER.debug("Listing vehicles")
         response = await self._request(
@@ -294,10 +807,11 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to retrieve EVs.")
-        evs = await response.json()
-        return [ElectricVehicle.model_validate(ev) for ev in evs]
+        return await self._read_model(response, _VEHICLE_LIST.validate_json)
 
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_home_chargers(self) -> List[int]:
         _LOGGER.debug("Searching for registered home chargers")
         response = await self._request(
@@ -307,7 +821,7 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to retrieve Home Flex chargers.")
-        data = (await response.json())["data"]
+        data = (await self._read_json(response))["data"]
         chargers = [int(item["id"]) for item in data]
         _LOGGER.debug(
             "Discovered %d home charger(s): %s",
@@ -316,7 +830,9 @@ class ChargePoint:
         )
         return chargers
 
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_home_charger_status(self, charger_id: int) -> HomeChargerStatus:
         _LOGGER.debug("Getting status for panda: %s", charger_id)
         response = await self._request(
@@ -326,11 +842,15 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to get home charger status.")
-        status = await response.json()
+        status = await self._read_json(response)
         _LOGGER.debug(status)
-        return HomeChargerStatus.model_validate({"charger_id": charger_id, **status})
+        return self._validate(
+            HomeChargerStatus.model_validate, {"charger_id": charger_id, **status}
+        )
 
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_home_charger_technical_info(
         self, charger_id: int
     ) -> HomeChargerTechnicalInfo:
@@ -342,9 +862,13 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to get home charger tech info.")
-        return HomeChargerTechnicalInfo.model_validate(await response.json())
+        return await self._read_model(
+            response, HomeChargerTechnicalInfo.model_validate_json
+        )
 
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_user_charging_status(self) -> Optional[UserChargingStatus]:
         _LOGGER.debug("Checking account charging status")
         request: dict = {"user_status": {"mfhs": {}}}
@@ -353,14 +877,15 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to get user charging status.")
-        status = await response.json()
+        status = await self._read_json(response)
         if not status["user_status"]:
             _LOGGER.debug("No user status returned, assuming not charging.")
             return None
 
         _LOGGER.debug("Raw status: %s", status)
-        return UserChargingStatus.model_validate(status["user_status"])
+        return self._validate(UserChargingStatus.model_validate, status["user_status"])
 
+    @_api_call
     @_require_login
     async def set_amperage_limit(self, charger_id: int, amperage_limit: int) -> None:
         _LOGGER.debug("Setting amperage limit for %s to %s", charger_id, amperage_limit)
@@ -374,6 +899,7 @@ class ChargePoint:
         await self._raise_for_status(response, "Failed to set amperage limit.")
         await response.release()
 
+    @_api_call
     @_require_login
     async def set_led_brightness(self, charger_id: int, level: int) -> None:
         """
@@ -393,6 +919,7 @@ class ChargePoint:
         await self._raise_for_status(response, "Failed to set LED brightness.")
         await response.release()
 
+    @_api_call
     @_require_login
     async def restart_home_charger(self, charger_id: int) -> None:
         _LOGGER.debug("Sending restart command for charger: %s", charger_id)
@@ -405,7 +932,9 @@ class ChargePoint:
         await self._raise_for_status(response, "Failed to restart charger.")
         await response.release()
 
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_home_charger_config(
         self, charger_id: int
     ) -> HomeChargerConfiguration:
@@ -417,9 +946,13 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to get charger configuration.")
-        return HomeChargerConfiguration.model_validate(await response.json())
+        return await self._read_model(
+            response, HomeChargerConfiguration.model_validate_json
+        )
 
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_home_charger_schedule(self, charger_id: int) -> HomeChargerSchedule:
         _LOGGER.debug("Getting schedule for charger: %s", charger_id)
         response = await self._request(
@@ -429,8 +962,27 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to get charger schedule.")
-        return HomeChargerSchedule.model_validate(await response.json())
+        return await self._read_model(response, HomeChargerSchedule.model_validate_json)
 
+    @_api_call
+    @_require_login
+    async def get_home_charger_snapshots(
+        self, charger_ids: Optional[Iterable[int]] = None, concurrency: int = 8
+    ) -> List[HomeChargerSnapshot]:
+        """
+        Fetch status, technical info, configuration and schedule for several home
+        chargers at once, with at most ``concurrency`` requests in flight.
+        :param charger_ids: Chargers to fetch; defaults to get_home_chargers().
+        :param concurrency: Maximum number of concurrent requests.
+        :return: One HomeChargerSnapshot per charger, in input order. A failed
+                 call leaves its part as None and is recorded in ``errors``
+                 instead of aborting the batch.
+        """
+        if charger_ids is None:
+            charger_ids = await self.get_home_chargers()
+        return await _collect_snapshots(self, charger_ids, concurrency)
+
+    @_api_call
     @_require_login
     async def set_home_charger_schedule(
         self,
@@ -454,8 +1006,9 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to set charger schedule.")
-        return HomeChargerSchedule.model_validate(await response.json())
+        return await self._read_model(response, HomeChargerSchedule.model_validate_json)
 
+    @_api_call
     @_require_login
     async def disable_home_charger_schedule(
         self, charger_id: int
@@ -469,43 +1022,289 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to disable charger schedule.")
-        return HomeChargerSchedule.model_validate(await response.json())
+        return await self._read_model(response, HomeChargerSchedule.model_validate_json)
 
+    def bulk_set_amperage_limit(
+        self,
+        charger_ids: Iterable[int],
+        amperage_limit: int,
+        concurrency: int = 16,
+        rate: Optional[float] = None,
+    ) -> AsyncGenerator[CommandResult, None]:
+        """
+        Set the same amperage limit on many chargers concurrently.
+        :param concurrency: Maximum number of commands in flight.
+        :param rate: Optional budget in commands/second for this batch, applied
+                     on top of the client's RateLimiter.
+        :return: An async iterator of CommandResult in completion order. Failed
+                 commands are yielded with ``error`` set. Pass it to
+                 BulkCommandReport.collect() for a summary. To stop early,
+                 iterate inside ``contextlib.aclosing()``; leaving the block
+                 cancels the commands not yet sent.
+        """
+        return _run_bulk(
+            charger_ids,
+            lambda charger_id: self.set_amperage_limit(charger_id, amperage_limit),
+            concurrency,
+            rate,
+        )
+
+    def bulk_set_led_brightness(
+        self,
+        charger_ids: Iterable[int],
+        level: int,
+        concurrency: int = 16,
+        rate: Optional[float] = None,
+    ) -> AsyncGenerator[CommandResult, None]:
+        """
+        Set the same LED brightness on many chargers, see
+        bulk_set_amperage_limit (including stopping early with aclosing()).
+        """
+        return _run_bulk(
+            charger_ids,
+            lambda charger_id: self.set_led_brightness(charger_id, level),
+            concurrency,
+            rate,
+        )
+
+    def bulk_set_home_charger_schedule(
+        self,
+        charger_ids: Iterable[int],
+        weekday_start: str,
+        weekday_end: str,
+        weekend_start: str,
+        weekend_end: str,
+        concurrency: int = 16,
+        rate: Optional[float] = None,
+    ) -> AsyncGenerator[CommandResult, None]:
+        """
+        Set the same charging schedule on many chargers, see
+        bulk_set_amperage_limit (including stopping early with aclosing()).
+        Successful results carry the new schedule.
+        """
+        return _run_bulk(
+            charger_ids,
+            lambda charger_id: self.set_home_charger_schedule(
+                charger_id, weekday_start, weekday_end, weekend_start, weekend_end
+            ),
+            concurrency,
+            rate,
+        )
+
+    @overload
+    async def get_charging_session(
+        self,
+        session_id: int,
+        raw: Literal[False] = ...,
+        *,
+        timeout: Optional[float] = None,
+    ) -> ChargingSession: ...
+
+    @overload
+    async def get_charging_session(
+        self, session_id: int, raw: Literal[True], *, timeout: Optional[float] = None
+    ) -> Dict[str, Any]: ...
+
+    @_api_call
     @_require_login
-    async def get_charging_session(self, session_id: int) -> ChargingSession:
+    async def get_charging_session(
+        self, session_id: int, raw: bool = False
+    ) -> Union[ChargingSession, Dict[str, Any]]:
+        """
+        Return a charging session. With ``raw=True`` the decoded charging_status
+        payload is returned without validation; ChargingSession.from_status()
+        validates it later if needed.
+        """
         session = ChargingSession(session_id=session_id)
         session._client = self
+        if raw:
+            return await session._fetch_status()
         await session.async_refresh()
         return session
 
-    @_require_login
+    @_api_call
+    @_require_login(replay=False)
     async def start_charging_session(self, device_id: int) -> ChargingSession:
         return await ChargingSession.start(device_id=device_id, client=self)
 
+    @_api_call
     @_require_login
-    async def get_station(self, device_id: int) -> StationInfo:
-        """Return detailed information about a charging station by device ID."""
+    async def begin_charging_session(self, device_id: int) -> PendingChargingSession:
+        """
+        Start a session without waiting for the station to confirm it. Returns
+        once the start command is accepted; await the returned handle for the
+        ChargingSession. ``timeout`` only bounds sending the command.
+        """
+        return await ChargingSession.begin(device_id=device_id, client=self)
+
+    @overload
+    async def get_station(
+        self,
+        device_id: int,
+        raw: Literal[False] = ...,
+        fields: None = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> StationInfo: ...
+
+    @overload
+    async def get_station(
+        self,
+        device_id: int,
+        raw: Literal[True],
+        fields: None = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]: ...
+
+    @overload
+    async def get_station(
+        self,
+        device_id: int,
+        raw: Literal[False] = ...,
+        *,
+        fields: Iterable[str],
+        timeout: Optional[float] = None,
+    ) -> BaseModel: ...
+
+    @_api_call
+    @_require_login
+    @_idempotent
+    async def get_station(
+        self,
+        device_id: int,
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Union[StationInfo, Dict[str, Any], BaseModel]:
+        """
+        Return detailed information about a charging station by device ID.
+
+        When the client has a StationCache, cached metadata is reused and only
+        stale status fields are refreshed, from the lighter map endpoint.
+
+        With ``raw=True`` the decoded response is returned as a dict without
+        validation and without touching the StationCache. Pass it to
+        StationInfo.model_validate() to validate it on demand.
+
+        ``fields`` limits the result to a slim projection of StationInfo (see
+        types.projection()) holding only the named fields. Projected reads also
+        bypass the StationCache.
+        """
+        if raw:
+            response = await self._station_response(device_id)
+            return await self._read_json(response)
+        if fields is not None:
+            response = await self._station_response(device_id)
+            model = projection(StationInfo, fields)
+            return await self._read_model(response, model.model_validate_json)
+
+        cache = self._station_cache
+        if cache is None:
+            return await self._fetch_station(device_id)
+
+        entry = cache.get(device_id)
+        if entry is not None:
+            if cache.status_fresh(entry):
+                cache.stats.hits += 1
+                return entry.info
+            station = await self._find_map_station(entry.info)
+            if station is not None:
+                cache.stats.status_refreshes += 1
+                cache.update_status(entry, station)
+                return entry.info
+
+        cache.stats.misses += 1
+        info = await self._fetch_station(device_id)
+        cache.put(info)
+        return info
+
+    async def _station_response(self, device_id: int) -> aiohttp.ClientResponse:
         url = (
             self._global_config.endpoints.mapcache_endpoint / "v3/station/info"
         ).update_query({"deviceId": str(device_id), "use_cache": "false"})
         response = await self._request("GET", url)
 
         await self._raise_for_status(response, "Failed to get station info.")
-        data = await response.json()
-        return StationInfo.model_validate(data)
+        return response
+
+    async def _fetch_station(self, device_id: int) -> StationInfo:
+        response = await self._station_response(device_id)
+        return await self._read_model(response, StationInfo.model_validate_json)
+
+    async def _find_map_station(self, info: StationInfo) -> Optional[MapStation]:
+        """Look a station up on the map API using a small box around its location."""
+        if not (info.latitude or info.longitude):
+            return None
+        margin = 0.001
+        bounds = ZoomBounds(
+            sw_lat=info.latitude - margin,
+            sw_lon=info.longitude - margin,
+            ne_lat=info.latitude + margin,
+            ne_lon=info.longitude + margin,
+        )
+        try:
+            stations = await self.get_nearby_stations(bounds)
+        except CommunicationError as exc:
+            _LOGGER.debug("Map status refresh failed for %s: %s", info.device_id, exc)
+            return None
+        return next((s for s in stations if s.device_id == info.device_id), None)
 
+    @overload
+    async def get_nearby_stations(
+        self,
+        bounds: ZoomBounds,
+        station_filter: Optional[MapFilter] = None,
+        raw: Literal[False] = ...,
+        fields: None = None,
+        *,
+        timeout: Optional[float] = None,
+    ) -> List[MapStation]: ...
+
+    @overload
+    async def get_nearby_stations(
+        self,
+        bounds: ZoomBounds,
+        station_filter: Optional[MapFilter] = None,
+        *,
+        raw: Literal[True],
+        fields: None = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]: ...
+
+    @overload
+    async def get_nearby_stations(
+        self,
+        bounds: ZoomBounds,
+        station_filter: Optional[MapFilter] = None,
+        raw: Literal[False] = ...,
+        *,
+        fields: Iterable[str],
+        timeout: Optional[float] = None,
+    ) -> List[BaseModel]: ...
+
+    @_api_call
     @_require_login
+    @_idempotent
     async def get_nearby_stations(
         self,
         bounds: ZoomBounds,
         station_filter: Optional[MapFilter] = None,
-    ) -> List[MapStation]:
+        raw: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Union[List[MapStation], List[Dict[str, Any]], List[BaseModel]]:
         """Return charging stations within the given bounding box.
 
         The API clusters stations into aggregate blobs when the bounding box
         covers too large an area; those blobs are not individual stations and
         are omitted from the result. If an unexpectedly empty list is returned,
         try narrowing the bounding box.
+
+        With ``raw=True`` the stations are returned as decoded dicts without
+        validation, for bulk reads of trusted data. Pass any of them to
+        MapStation.model_validate() to validate it on demand.
+
+        ``fields`` limits each station to a slim projection of MapStation (see
+        types.projection()), e.g. ``fields=["device_id", "lat", "lon", "ports"]``.
         """
         _LOGGER.debug("Fetching nearby stations within %s", bounds)
         request = {
@@ -527,6 +1326,14 @@ class ChargePoint:
         )
 
         await self._raise_for_status(response, "Failed to get nearby stations.")
-        data = await response.json()
-        stations = data["map_data"].get("stations", [])
-        return [MapStation.model_validate(s) for s in stations]
+        if raw:
+            data = await self._read_json(response)
+            return data.get("map_data", {}).get("stations", [])
+        if fields is not None:
+            envelope = _map_response(projection(MapStation, fields))
+            projected: Any = await self._read_model(
+                response, envelope.model_validate_json
+            )
+            return projected.map_data.stations
+        parsed = await self._read_model(response, _MapResponse.model_validate_json)
+        return parsed.map_data.stations
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+class JSONCodec:
+    """Encodes request bodies and decodes response bodies using the stdlib."""
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonCodec(JSONCodec):
+    """Faster codec backed by orjson, if it is installed."""
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError("orjson is not installed")
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+def default_codec() -> JSONCodec:
+    """Return an OrjsonCodec when orjson is importable, else the stdlib codec."""
+    return OrjsonCodec() if orjson is not None else JSONCodec()
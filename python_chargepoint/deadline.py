@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+from .exceptions import DeadlineExceeded
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout_at
+else:  # pragma: no cover
+    from async_timeout import timeout_at
+
+_DEADLINE: ContextVar[Optional[float]] = ContextVar(
+    "chargepoint_deadline", default=None
+)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current call's deadline, or None if unbounded."""
+    when = _DEADLINE.get()
+    if when is None:
+        return None
+    return max(0.0, when - asyncio.get_running_loop().time())
+
+
+def detach() -> None:
+    """
+    Drop the inherited deadline in a background task, which copies the context
+    of the call that spawned it but may outlive that call.
+    """
+    _DEADLINE.set(None)
+
+
+@asynccontextmanager
+async def deadline(timeout: Optional[float]) -> AsyncIterator[None]:
+    """
+    Bound the enclosed block to ``timeout`` seconds, raising DeadlineExceeded.
+
+    Deadlines nest: an inner block never outlives the deadline of the call
+    that contains it, so one timeout covers connects, reads and any polling
+    done by nested calls.
+    """
+    loop = asyncio.get_running_loop()
+    outer = _DEADLINE.get()
+    when = None if timeout is None else loop.time() + timeout
+    if when is None or (outer is not None and outer <= when):
+        # Either unbounded or already covered by an enclosing deadline.
+        yield
+        return
+
+    token = _DEADLINE.set(when)
+    try:
+        async with timeout_at(when):
+            yield
+    except asyncio.TimeoutError as exc:
+        if loop.time() < when:
+            raise
+        raise DeadlineExceeded(f"Call did not complete within {timeout}s") from exc
+    finally:
+        _DEADLINE.reset(token)
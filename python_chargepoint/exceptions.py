@@ -49,3 +49,20 @@ class DatadomeCaptcha(APIError):
         self.captcha = captcha
         self.message = message
         super().__init__(self.message)
+
+
+class CircuitOpenError(APIError):
+    """
+    Requests to a host are failing fast because its circuit breaker is open.
+    """
+
+    def __init__(self, host: str, message: str):
+        self.host = host
+        self.message = message
+        super().__init__(self.message)
+
+
+class DeadlineExceeded(APIError):
+    """
+    A call did not complete within its timeout.
+    """
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+import aiohttp
+
+from .exceptions import APIError
+from .ratelimit import TokenBucket
+from .types import (
+    HomeChargerConfiguration,
+    HomeChargerSchedule,
+    HomeChargerStatus,
+    HomeChargerTechnicalInfo,
+)
+
+if TYPE_CHECKING:
+    from .client import ChargePoint
+
+# Errors recorded per charger instead of aborting the batch. ValueError covers
+# pydantic validation errors.
+_CHARGER_ERRORS = (APIError, aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+
+
+@dataclass
+class HomeChargerSnapshot:
+    """
+    Everything known about one home charger. Parts that failed to load are None
+    and the corresponding exception is kept in ``errors``, keyed by part name.
+    """
+
+    charger_id: int
+    status: Optional[HomeChargerStatus] = None
+    technical_info: Optional[HomeChargerTechnicalInfo] = None
+    config: Optional[HomeChargerConfiguration] = None
+    schedule: Optional[HomeChargerSchedule] = None
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+async def _collect_snapshots(
+    client: ChargePoint, charger_ids: Iterable[int], concurrency: int
+) -> List[HomeChargerSnapshot]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+    snapshots = [HomeChargerSnapshot(charger_id=c) for c in charger_ids]
+
+    async def load(
+        snapshot: HomeChargerSnapshot,
+        part: str,
+        fetch: Callable[[int], Awaitable[Any]],
+    ) -> None:
+        async with semaphore:
+            try:
+                setattr(snapshot, part, await fetch(snapshot.charger_id))
+            except _CHARGER_ERRORS as exc:
+                snapshot.errors[part] = exc
+
+    parts = {
+        "status": client.get_home_charger_status,
+        "technical_info": client.get_home_charger_technical_info,
+        "config": client.get_home_charger_config,
+        "schedule": client.get_home_charger_schedule,
+    }
+    await asyncio.gather(
+        *(
+            load(snapshot, part, fetch)
+            for snapshot in snapshots
+            for part, fetch in parts.items()
+        )
+    )
+    return snapshots
+
+
+@dataclass
+class CommandResult:
+    """Outcome of one command in a bulk operation."""
+
+    charger_id: int
+    result: Any = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkCommandReport:
+    """All results of a bulk operation, in completion order."""
+
+    results: List[CommandResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> List[CommandResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[CommandResult]:
+        return [r for r in self.results if not r.ok]
+
+    @classmethod
+    async def collect(cls, results: AsyncIterator[CommandResult]) -> BulkCommandReport:
+        """Drain a bulk command stream into a report."""
+        start = time.monotonic()
+        report = cls()
+        async for result in results:
+            report.results.append(result)
+        report.elapsed = time.monotonic() - start
+        return report
+
+
+async def _run_bulk(
+    charger_ids: Iterable[int],
+    command: Callable[[int], Awaitable[Any]],
+    concurrency: int,
+    rate: Optional[float],
+) -> AsyncGenerator[CommandResult, None]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(rate, float(concurrency)) if rate is not None else None
+
+    async def run(charger_id: int) -> CommandResult:
+        async with semaphore:
+            if bucket is not None:
+                await bucket.acquire()
+            start = time.monotonic()
+            try:
+                result = await command(charger_id)
+            except _CHARGER_ERRORS as exc:
+                return CommandResult(
+                    charger_id, error=exc, elapsed=time.monotonic() - start
+                )
+            return CommandResult(charger_id, result, elapsed=time.monotonic() - start)
+
+    tasks = [asyncio.ensure_future(run(c)) for c in charger_ids]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        # Stop dispatching when the generator is closed, e.g. by aclosing()
+        # after the consumer stops iterating early.
+        for task in tasks:
+            task.cancel()
@@ -1,11 +1,20 @@
 from typing import Annotated, List
 
-from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, model_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    model_validator,
+)
 from pydantic.alias_generators import to_camel
 from yarl import URL
 
 EndpointURL = Annotated[
-    URL, BeforeValidator(lambda v: URL(v) if isinstance(v, str) else v)
+    URL,
+    BeforeValidator(lambda v: URL(v) if isinstance(v, str) else v),
+    PlainSerializer(str, return_type=str, when_used="json"),
 ]
 
 
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import aiohttp
+
+_OPERATION: ContextVar[Optional[str]] = ContextVar(
+    "python_chargepoint_operation", default=None
+)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+TimingCallback = Callable[[str, str, float], None]
+
+
+def current_operation() -> str:
+    """Return the logical client method currently running, or "unknown"."""
+    return _OPERATION.get() or "unknown"
+
+
+@contextmanager
+def operation(name: str) -> Iterator[None]:
+    """Label timings recorded inside the block with ``name``."""
+    token = _OPERATION.set(name)
+    try:
+        yield
+    finally:
+        _OPERATION.reset(token)
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket latency histogram, in seconds."""
+
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self):
+        # One slot per bucket plus the implicit +Inf bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class Instrumentation:
+    """
+    Records where time goes inside a client, per logical operation and phase.
+
+    Operations are the public client methods (``get_home_charger_status``,
+    ``get_nearby_stations``, ...) plus ``<action>_command`` and
+    ``<action>_command_ack`` for session commands and their ack polling.
+    Phases are:
+
+    * ``dns``, ``connect`` and ``ttfb`` from aiohttp trace hooks. ``connect``
+      covers TCP and TLS setup; aiohttp does not report the handshake separately.
+    * ``read``, ``decode`` and ``validate`` for response processing. Models
+      validated straight from bytes report decoding and validation together
+      as ``validate``.
+    * ``total`` for the whole method call.
+
+    Every observation is added to an in-memory histogram and passed to the
+    registered callbacks as ``(operation, phase, seconds)``.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.callbacks: List[TimingCallback] = []
+
+    def add_callback(self, callback: TimingCallback) -> None:
+        self.callbacks.append(callback)
+
+    def observe(self, phase: str, seconds: float) -> None:
+        name = current_operation()
+        histogram = self.histograms.get((name, phase))
+        if histogram is None:
+            histogram = self.histograms[(name, phase)] = Histogram(self._buckets)
+        histogram.observe(seconds)
+        for callback in self.callbacks:
+            callback(name, phase, seconds)
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Return a TraceConfig feeding the connection phases. Clients add it to the
+        sessions they create; pass it in ``trace_configs`` when creating your own.
+        """
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(self._on_request_start)
+        config.on_dns_resolvehost_start.append(self._on_dns_resolvehost_start)
+        config.on_dns_resolvehost_end.append(self._on_dns_resolvehost_end)
+        config.on_connection_create_start.append(self._on_connection_create_start)
+        config.on_connection_create_end.append(self._on_connection_create_end)
+        config.on_request_end.append(self._on_request_end)
+        return config
+
+    async def _on_request_start(self, session, ctx: SimpleNamespace, params) -> None:
+        ctx.request_start = time.perf_counter()
+
+    async def _on_dns_resolvehost_start(
+        self, session, ctx: SimpleNamespace, params
+    ) -> None:
+        ctx.dns_start = time.perf_counter()
+
+    async def _on_dns_resolvehost_end(
+        self, session, ctx: SimpleNamespace, params
+    ) -> None:
+        self.observe("dns", time.perf_counter() - ctx.dns_start)
+
+    async def _on_connection_create_start(
+        self, session, ctx: SimpleNamespace, params
+    ) -> None:
+        ctx.connect_start = time.perf_counter()
+
+    async def _on_connection_create_end(
+        self, session, ctx: SimpleNamespace, params
+    ) -> None:
+        self.observe("connect", time.perf_counter() - ctx.connect_start)
+
+    async def _on_request_end(self, session, ctx: SimpleNamespace, params) -> None:
+        # on_request_end fires once the response headers have been received.
+        self.observe("ttfb", time.perf_counter() - ctx.request_start)
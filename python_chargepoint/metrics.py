@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cache import StationCache
+from .instrumentation import DEFAULT_BUCKETS, Histogram, current_operation
+from .singleflight import SingleFlight
+
+ACK_ATTEMPT_BUCKETS = (1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 40.0)
+ACK_DURATION_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metrics:
+    """
+    Counters, gauges and histograms describing a client's load on the
+    ChargePoint backend, rendered as OpenMetrics text by ``render()``.
+
+    Clients update the metrics from the event loop without locks, so share one
+    instance only between clients running on the same loop (for example all
+    clients of a ChargePointPool). Requests are labelled with the logical
+    operation (the public method name), the API host and the status code.
+    Station cache and single-flight statistics are read at render time from
+    the objects registered by the clients.
+    """
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        self.request_duration: Dict[Tuple[str, str], Histogram] = {}
+        self.in_flight: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.ack_attempts: Dict[Tuple[str, str], Histogram] = {}
+        self.ack_duration: Dict[Tuple[str, str], Histogram] = {}
+        self._station_caches: weakref.WeakSet[StationCache] = weakref.WeakSet()
+        self._single_flights: weakref.WeakSet[SingleFlight] = weakref.WeakSet()
+
+    def request_started(self, host: str) -> None:
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+
+    def request_finished(self, host: str, status: str, seconds: float) -> None:
+        self.in_flight[host] -= 1
+        name = current_operation()
+        key = (name, host, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        histogram = self.request_duration.get((name, host))
+        if histogram is None:
+            histogram = self.request_duration[(name, host)] = Histogram(DEFAULT_BUCKETS)
+        histogram.observe(seconds)
+
+    def record_error(self, kind: str) -> None:
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def record_ack(
+        self,
+        action: str,
+        attempts: int,
+        confirmed: bool,
+        seconds: Optional[float] = None,
+    ) -> None:
+        key = (action, "confirmed" if confirmed else "failed")
+        histogram = self.ack_attempts.get(key)
+        if histogram is None:
+            histogram = self.ack_attempts[key] = Histogram(ACK_ATTEMPT_BUCKETS)
+        histogram.observe(attempts)
+        if seconds is not None:
+            duration = self.ack_duration.get(key)
+            if duration is None:
+                duration = self.ack_duration[key] = Histogram(ACK_DURATION_BUCKETS)
+            duration.observe(seconds)
+
+    def track_station_cache(self, cache: StationCache) -> None:
+        self._station_caches.add(cache)
+
+    def track_single_flight(self, single_flight: SingleFlight) -> None:
+        self._single_flights.add(single_flight)
+
+    def render(self) -> str:
+        """Return all metrics in the OpenMetrics text exposition format."""
+        lines: List[str] = []
+        self._render_counter(
+            lines,
+            "chargepoint_requests",
+            "HTTP requests sent to the ChargePoint API.",
+            (
+                ((("operation", op), ("host", host), ("status", status)), count)
+                for (op, host, status), count in sorted(self.requests.items())
+            ),
+        )
+        self._render_histograms(
+            lines,
+            "chargepoint_request_duration_seconds",
+            "Time until response headers were received.",
+            (
+                ((("operation", op), ("host", host)), histogram)
+                for (op, host), histogram in sorted(self.request_duration.items())
+            ),
+        )
+        self._render_gauge(
+            lines,
+            "chargepoint_requests_in_flight",
+            "Requests currently awaiting a response.",
+            (
+                ((("host", host),), count)
+                for host, count in sorted(self.in_flight.items())
+            ),
+        )
+        self._render_counter(
+            lines,
+            "chargepoint_errors",
+            "Session and bot-protection errors returned by the API.",
+            (((("type", kind),), count) for kind, count in sorted(self.errors.items())),
+        )
+        self._render_histograms(
+            lines,
+            "chargepoint_command_ack_attempts",
+            "Acknowledgement polls needed for a session command.",
+            (
+                ((("action", action), ("outcome", outcome)), histogram)
+                for (action, outcome), histogram in sorted(self.ack_attempts.items())
+            ),
+        )
+        self._render_histograms(
+            lines,
+            "chargepoint_command_ack_duration_seconds",
+            "Time from the first acknowledgement poll until the command was confirmed or given up.",
+            (
+                ((("action", action), ("outcome", outcome)), histogram)
+                for (action, outcome), histogram in sorted(self.ack_duration.items())
+            ),
+        )
+        self._render_caches(lines)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _render_caches(self, lines: List[str]) -> None:
+        hits = refreshes = misses = 0
+        for cache in self._station_caches:
+            hits += cache.stats.hits
+            refreshes += cache.stats.status_refreshes
+            misses += cache.stats.misses
+        total = hits + refreshes + misses
+        self._render_counter(
+            lines,
+            "chargepoint_station_cache_lookups",
+            "StationCache lookups by result.",
+            [
+                ((("result", "hit"),), hits),
+                ((("result", "status_refresh"),), refreshes),
+                ((("result", "miss"),), misses),
+            ],
+        )
+        self._render_gauge(
+            lines,
+            "chargepoint_station_cache_hit_ratio",
+            "Share of StationCache lookups served without a full station fetch.",
+            [((), (hits + refreshes) / total if total else 0.0)],
+        )
+
+        calls = sum(f.stats.calls for f in self._single_flights)
+        deduplicated = sum(f.stats.deduplicated for f in self._single_flights)
+        self._render_counter(
+            lines,
+            "chargepoint_read_calls",
+            "Read method calls by whether they joined an in-flight request.",
+            [
+                ((("coalesced", "false"),), calls - deduplicated),
+                ((("coalesced", "true"),), deduplicated),
+            ],
+        )
+
+    @staticmethod
+    def _render_counter(
+        lines: List[str],
+        name: str,
+        help_text: str,
+        samples: Iterable[Tuple[Labels, float]],
+    ) -> None:
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"# HELP {name} {help_text}")
+        for labels, value in samples:
+            lines.append(f"{name}_total{_format_labels(labels)} {_format_value(value)}")
+
+    @staticmethod
+    def _render_gauge(
+        lines: List[str],
+        name: str,
+        help_text: str,
+        samples: Iterable[Tuple[Labels, float]],
+    ) -> None:
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"# HELP {name} {help_text}")
+        for labels, value in samples:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    @staticmethod
+    def _render_histograms(
+        lines: List[str],
+        name: str,
+        help_text: str,
+        samples: Iterable[Tuple[Labels, Histogram]],
+    ) -> None:
+        lines.append(f"# TYPE {name} histogram")
+        lines.append(f"# HELP {name} {help_text}")
+        for labels, histogram in samples:
+            cumulative = 0
+            bounds = [repr(float(b)) for b in histogram.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                bucket_labels = _format_labels(labels + (("le", bound),))
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+            lines.append(
+                f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}"
+            )
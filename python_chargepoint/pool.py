@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+
+from .cache import DiscoveryCache
+from .client import ChargePoint
+from .constants import _LOGGER
+from .global_config import GlobalConfiguration
+from .instrumentation import Instrumentation
+from .metrics import Metrics
+from .ratelimit import RateLimiter
+from .retry import CircuitBreakers, RetryPolicy
+from .token_store import TokenStore
+
+LoginCallback = Callable[[ChargePoint], Awaitable[None]]
+
+
+@dataclass
+class _PooledAccount:
+    username: str
+    coulomb_token: str
+    login: Optional[LoginCallback]
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    client: Optional[ChargePoint] = None
+
+
+class ChargePointPool:
+    """
+    Manages many ChargePoint accounts over one shared connection pool.
+
+    All accounts share a single ClientSession and TCPConnector; a connector
+    passed in by the caller is left open by close(). Clients run
+    without a cookie jar and hold their own session token, so tokens never
+    leak between accounts while sockets are reused across all of them. Clients
+    are created and logged in lazily, the first time an account is used.
+    The rate limiter, retry policy, circuit breakers, timeout, metrics and
+    token store are shared by every pooled client.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        per_account_limit: int = 4,
+        discovery_cache: Optional[DiscoveryCache] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        timeout: Optional[float] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        metrics: Optional[Metrics] = None,
+        token_store: Optional[TokenStore] = None,
+    ):
+        self._limit = limit
+        self._per_account_limit = per_account_limit
+        self._discovery_cache = discovery_cache
+        self._connector = connector
+        self._owns_connector = connector is None
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._circuit_breakers = circuit_breakers
+        self._timeout = timeout
+        self._instrumentation = instrumentation
+        self._metrics = metrics
+        self._token_store = token_store
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._accounts: Dict[str, _PooledAccount] = {}
+        self._configs: Dict[str, GlobalConfiguration] = {}
+
+    @property
+    def connector(self) -> aiohttp.BaseConnector:
+        if self._connector is None:
+            self._connector = aiohttp.TCPConnector(limit=self._limit)
+        return self._connector
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=self.connector,
+                connector_owner=False,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                trace_configs=(
+                    [self._instrumentation.trace_config()]
+                    if self._instrumentation
+                    else None
+                ),
+            )
+        return self._session
+
+    @property
+    def usernames(self) -> List[str]:
+        return list(self._accounts)
+
+    def add_account(
+        self,
+        username: str,
+        coulomb_token: str = "",
+        login: Optional[LoginCallback] = None,
+    ) -> None:
+        """
+        Register an account without contacting the API.
+        :param username: Account username
+        :param coulomb_token: Session token, if already known
+        :param login: Coroutine function called with the new client when no
+                      token is provided or found in the pool's token store,
+                      e.g. ``lambda c: c.login_with_password(pw)``. It is also
+                      used to log in again when the session expires.
+        """
+        if not coulomb_token and login is None:
+            raise ValueError("Either a coulomb_token or a login callback is required")
+        if username in self._accounts:
+            raise ValueError(f"Account {username} is already registered")
+        self._accounts[username] = _PooledAccount(
+            username=username,
+            coulomb_token=coulomb_token,
+            login=login,
+            semaphore=asyncio.Semaphore(self._per_account_limit),
+        )
+
+    async def remove_account(self, username: str) -> None:
+        account = self._accounts.pop(username)
+        await self._close_account(account)
+
+    @asynccontextmanager
+    async def client(self, username: str) -> AsyncIterator[ChargePoint]:
+        """
+        Borrow the client for an account, creating and logging it in if needed.
+        At most ``per_account_limit`` borrowers hold the same account at once.
+        """
+        account = self._accounts[username]
+        async with account.semaphore:
+            yield await self._ensure_client(account)
+
+    async def _ensure_client(self, account: _PooledAccount) -> ChargePoint:
+        async with account.lock:
+            if account.client is not None:
+                return account.client
+
+            _LOGGER.debug("Creating pooled client for %s", account.username)
+            client = await ChargePoint.create(
+                account.username,
+                account.coulomb_token,
+                session=self.session,
+                discovery_cache=self._discovery_cache,
+                use_cookie_jar=False,
+                rate_limiter=self._rate_limiter,
+                retry_policy=self._retry_policy,
+                circuit_breakers=self._circuit_breakers,
+                timeout=self._timeout,
+                instrumentation=self._instrumentation,
+                metrics=self._metrics,
+                token_store=self._token_store,
+                relogin=account.login,
+            )
+            client._global_config = self._shared_config(client.global_config)
+            if client.coulomb_token is None:
+                assert account.login is not None
+                try:
+                    await account.login(client)
+                except BaseException:
+                    await client.close()
+                    raise
+
+            account.client = client
+            return client
+
+    def _shared_config(self, config: GlobalConfiguration) -> GlobalConfiguration:
+        # Accounts in the same region get identical configurations; keep one
+        # parsed copy of each instead of one per client.
+        key = config.model_dump_json(by_alias=True)
+        return self._configs.setdefault(key, config)
+
+    async def _close_account(self, account: _PooledAccount) -> None:
+        if account.client is not None:
+            await account.client.close()
+        account.client = None
+
+    async def close(self) -> None:
+        for account in self._accounts.values():
+            await self._close_account(account)
+        if self._session is not None:
+            await self._session.close()
+        if self._connector is not None and self._owns_connector:
+            await self._connector.close()
+
+    async def __aenter__(self) -> ChargePointPool:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
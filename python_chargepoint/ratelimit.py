@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+from .constants import _LOGGER
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket. Callers reserve a token up front, letting the balance
+    go negative, and sleep until their reservation is covered. This keeps the
+    bucket fair without locks.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        self._refill()
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class _HostBucket(TokenBucket):
+    def __init__(self, rate: float, burst: float):
+        super().__init__(rate, burst)
+        self.max_rate = rate
+        self.ceiling = rate
+
+
+class RateLimiter:
+    """
+    Per-host rate limiter that adapts to Datadome blocks.
+
+    Each endpoint host (hcpo_hcm_endpoint, mapcache_endpoint, ...) gets its own
+    token bucket. A 403 response multiplies the host's rate by ``backoff`` and
+    caps future growth at ``headroom`` times the rate that was blocked.
+    Successful responses add ``recovery`` requests/second back, so sustained
+    throughput settles just below the block threshold instead of oscillating.
+
+    Share one instance between clients (see shared_rate_limiter()) so that the
+    limits apply to the whole process.
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: float = 10.0,
+        host_rates: Optional[Dict[str, float]] = None,
+        min_rate: float = 0.2,
+        backoff: float = 0.5,
+        recovery: float = 0.05,
+        headroom: float = 0.9,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.host_rates = dict(host_rates or {})
+        self.min_rate = min_rate
+        self.backoff = backoff
+        self.recovery = recovery
+        self.headroom = headroom
+        self._buckets: Dict[str, _HostBucket] = {}
+
+    def _bucket(self, host: str) -> _HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate = self.host_rates.get(host, self.rate)
+            bucket = self._buckets[host] = _HostBucket(rate, max(1.0, self.burst))
+        return bucket
+
+    def current_rate(self, host: str) -> float:
+        return self._bucket(host).rate
+
+    async def acquire(self, host: str) -> None:
+        await self._bucket(host).acquire()
+
+    def record(self, host: str, status: int) -> None:
+        bucket = self._bucket(host)
+        if status == 403:
+            bucket.ceiling = max(self.min_rate, bucket.rate * self.headroom)
+            bucket.rate = max(self.min_rate, bucket.rate * self.backoff)
+            _LOGGER.warning(
+                "Request to %s was blocked; slowing down to %.2f requests/s",
+                host,
+                bucket.rate,
+            )
+        elif status < 400:
+            # The ceiling creeps back up slowly so a lifted block is rediscovered.
+            bucket.ceiling = min(bucket.max_rate, bucket.ceiling + self.recovery * 0.01)
+            bucket.rate = min(bucket.ceiling, bucket.rate + self.recovery)
+
+
+_shared_rate_limiter: Optional[RateLimiter] = None
+
+
+def shared_rate_limiter() -> RateLimiter:
+    """Return the process-wide RateLimiter, creating it with defaults if needed."""
+    global _shared_rate_limiter
+    if _shared_rate_limiter is None:
+        _shared_rate_limiter = RateLimiter()
+    return _shared_rate_limiter
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict
+
+import aiohttp
+
+from .constants import _LOGGER
+from .deadline import remaining
+from .exceptions import CircuitOpenError, CommunicationError
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retries idempotent calls that fail with a 5xx response or a connection error,
+    sleeping for an exponentially growing, jittered delay between attempts.
+    """
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    jitter: float = 0.5
+
+    def delay(self, attempt: int) -> float:
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return backoff * (1 - self.jitter * random.random())
+
+    @staticmethod
+    def is_retryable(exc: BaseException) -> bool:
+        if isinstance(exc, CommunicationError):
+            return exc.response.status >= 500
+        if isinstance(exc, CircuitOpenError):
+            return False
+        return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    async def run(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        attempt = 1
+        while True:
+            try:
+                return await fn()
+            except Exception as exc:
+                if attempt >= self.attempts or not self.is_retryable(exc):
+                    raise
+                delay = self.delay(attempt)
+                left = remaining()
+                if left is not None and delay >= left:
+                    # The retry could not finish before the call's deadline.
+                    raise
+                _LOGGER.warning(
+                    "Attempt %d/%d failed (%s); retrying in %.2fs",
+                    attempt,
+                    self.attempts,
+                    exc,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures for one host.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast with CircuitOpenError. Once ``reset_timeout`` seconds
+    have passed a single probe request is let through; its outcome closes or
+    re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, host: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+
+    def before_request(self) -> None:
+        if self.state == self.CLOSED:
+            return
+        # A probe that never reported back (e.g. it was cancelled) does not keep
+        # the circuit half-open forever: another probe goes out after the timeout.
+        now = time.monotonic()
+        if now - self._opened_at >= self.reset_timeout:
+            _LOGGER.debug("Circuit for %s is half-open; sending probe", self.host)
+            self.state = self.HALF_OPEN
+            self._opened_at = now
+            return
+        raise CircuitOpenError(
+            self.host, f"Circuit breaker for {self.host} is open; failing fast."
+        )
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                _LOGGER.warning("Opening circuit breaker for %s", self.host)
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+class CircuitBreakers:
+    """Registry of per-host circuit breakers; share it between clients if desired."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def for_host(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                host, self.failure_threshold, self.reset_timeout
+            )
+        return breaker
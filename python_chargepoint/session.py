@@ -1,11 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass, field
 
 import aiohttp
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -13,9 +24,41 @@ if TYPE_CHECKING:
     from .client import ChargePoint
 
 from .constants import _LOGGER
+from .deadline import deadline, detach
 from .exceptions import APIError, CommunicationError
+from .instrumentation import operation
+from .timeseries import SessionTimeSeries
+from .tracing import span
 from .types import ChargingSessionUpdate, PowerUtility, VehicleInfo
 
+# charging_state values, compared case-insensitively, used by watch().
+SESSION_ENDED_STATES = frozenset({"done"})
+SESSION_IDLE_STATES = frozenset({"fully_charged"})
+
+
+@dataclass
+class AckPollingStrategy:
+    """
+    How session commands poll for their acknowledgement. The first poll is sent
+    right away; the next one ``first_delay`` seconds later, and each following
+    delay grows by ``multiplier`` up to ``max_delay``. Polling gives up after
+    ``max_attempts`` polls or once the next poll would start more than
+    ``timeout`` seconds after the first. Cancelling the command stops polling.
+    """
+
+    first_delay: float = 0.5
+    multiplier: float = 1.5
+    max_delay: float = 2.0
+    max_attempts: int = 40
+    timeout: Optional[float] = 60.0
+
+    def delays(self) -> Iterator[float]:
+        """Yield the delay before each poll after the first."""
+        delay = self.first_delay
+        for _ in range(self.max_attempts - 1):
+            yield delay
+            delay = min(self.max_delay, delay * self.multiplier)
+
 
 async def _send_command(
     client: ChargePoint,
@@ -24,6 +67,18 @@ async def _send_command(
     port_number: int = 1,
     session_id: int = 0,
 ) -> None:
+    ack_id = await _submit_command(client, action, device_id, port_number, session_id)
+    await _await_ack(client, action, ack_id)
+
+
+async def _submit_command(
+    client: ChargePoint,
+    action: str,
+    device_id: int,
+    port_number: int = 1,
+    session_id: int = 0,
+) -> Any:
+    """Send a start/stop command and return the ackId to poll for."""
     if action not in ["start", "stop"]:
         raise AttributeError(f"Invalid action: {action}")
 
@@ -40,27 +95,41 @@ async def _send_command(
         "stop": "stopSession",
     }
 
-    response = await client._request(
-        "POST",
-        client.global_config.endpoints.accounts_endpoint
-        / f"v1/driver/station/{action_path[action]}",
-        json=request,
-    )
-
-    if response.status != 200:
-        text = await response.text()
-        _LOGGER.error(
-            "Failed to send command to station! status_code=%s err=%s",
-            response.status,
-            text,
-        )
-        raise CommunicationError(
-            response=response, message=f"Failed to {action} ChargePoint session."
+    with operation(f"{action}_command"), span(
+        f"ChargingSession.{action}_command", {"chargepoint.device_id": device_id}
+    ):
+        # A rejected token means the command was not accepted, so it is safe
+        # to send again after logging in.
+        response = await client._with_relogin(
+            lambda: client._request(
+                "POST",
+                client.global_config.endpoints.accounts_endpoint
+                / f"v1/driver/station/{action_path[action]}",
+                json=request,
+            )
         )
 
-    action_status = await response.json()
-    ack_id = action_status.get("ackId")
+        if response.status != 200:
+            text = await response.text()
+            _LOGGER.error(
+                "Failed to send command to station! status_code=%s err=%s",
+                response.status,
+                text,
+            )
+            raise CommunicationError(
+                response=response, message=f"Failed to {action} ChargePoint session."
+            )
+
+        action_status = await client._read_json(response)
+    return action_status.get("ackId")
 
+
+async def _await_ack(client: ChargePoint, action: str, ack_id: Any) -> None:
+    """
+    Poll until the station confirms a command, per client.ack_polling. If the
+    session expires meanwhile, the client logs in again and keeps polling the
+    same ackId rather than sending the command again.
+    """
     ack_request = {
         "ackId": ack_id,
         "action": f"{action}_session",
@@ -76,41 +145,68 @@ async def _send_command(
     error_id: Optional[int] = None
     error_category: Optional[str] = None
 
-    for attempt in range(1, 21):
-        _LOGGER.debug(
-            "Checking station modification status for ackId=%s (attempt %d/20)",
-            ack_id,
-            attempt,
-        )
-        ack_response = await client._request("POST", ack_url, json=ack_request)
-
-        if ack_response.status == 200:
-            _LOGGER.info("Successfully confirmed %s command.", action)
-            await ack_response.release()
-            return
-
-        try:
-            body = await ack_response.json(content_type=None) or {}
-        except Exception:
-            body = {}
-        error_message = body.get("errorMessage", f"Session failed to {action}.")
-        error_id = body.get("errorId")
-        error_category = body.get("errorCategory")
-        _LOGGER.warning(
-            "Station modification not yet confirmed (attempt %d/20): status_code=%s err=%s (id=%s, category=%s)",
-            attempt,
-            ack_response.status,
-            error_message,
-            error_id,
-            error_category,
-        )
+    strategy = client.ack_polling
+    delays = strategy.delays()
+    started = time.monotonic()
+    attempt = 0
+
+    with operation(f"{action}_command_ack"), client._timed("total"), span(
+        f"ChargingSession.{action}_command_ack"
+    ) as ack_span:
+        while True:
+            attempt += 1
+            _LOGGER.debug(
+                "Checking station modification status for ackId=%s (attempt %d/%d)",
+                ack_id,
+                attempt,
+                strategy.max_attempts,
+            )
+            ack_response = await client._with_relogin(
+                lambda: client._request("POST", ack_url, json=ack_request)
+            )
+
+            if ack_response.status == 200:
+                _LOGGER.info("Successfully confirmed %s command.", action)
+                await ack_response.release()
+                if client.metrics is not None:
+                    client.metrics.record_ack(
+                        action, attempt, True, time.monotonic() - started
+                    )
+                if ack_span is not None:
+                    ack_span.set_attribute("chargepoint.ack.attempts", attempt)
+                return
+
+            try:
+                body = await client._read_json(ack_response) or {}
+            except Exception:
+                body = {}
+            error_message = body.get("errorMessage", f"Session failed to {action}.")
+            error_id = body.get("errorId")
+            error_category = body.get("errorCategory")
+            _LOGGER.warning(
+                "Station modification not yet confirmed (attempt %d/%d): status_code=%s err=%s (id=%s, category=%s)",
+                attempt,
+                strategy.max_attempts,
+                ack_response.status,
+                error_message,
+                error_id,
+                error_category,
+            )
 
-        if attempt < 20:
-            await asyncio.sleep(3)
+            delay = next(delays, None)
+            if delay is None or (
+                strategy.timeout is not None
+                and time.monotonic() - started + delay > strategy.timeout
+            ):
+                break
+            await asyncio.sleep(delay)
 
     assert ack_response is not None
+    if client.metrics is not None:
+        client.metrics.record_ack(action, attempt, False, time.monotonic() - started)
     _LOGGER.error(
-        "Failed to confirm station modification after 20 attempts: err=%s (id=%s, category=%s)",
+        "Failed to confirm station modification after %d attempts: err=%s (id=%s, category=%s)",
+        attempt,
         error_message,
         error_id,
         error_category,
@@ -173,6 +269,16 @@ class _ChargingStatusData(BaseModel):
         return datetime.fromtimestamp(v / 1000, tz=timezone.utc)
 
 
+@dataclass
+class SessionChange:
+    """What a ChargingSession.watch() poll found."""
+
+    # Fields whose value changed, with their new value.
+    changes: Dict[str, Any]
+    # update_data points newer than the previous poll, oldest first.
+    updates: List[ChargingSessionUpdate]
+
+
 @dataclass
 class ChargingSession:
     session_id: int
@@ -223,7 +329,7 @@ class ChargingSession:
     # Typed as Optional since they're populated on first async_refresh()
     start_time: Optional[datetime] = None
     last_update_data_timestamp: Optional[datetime] = None
-    update_data: Optional[List[ChargingSessionUpdate]] = None
+    update_data: Optional[SessionTimeSeries] = None
     utility: Optional[PowerUtility] = None
     vehicle_info: Optional[VehicleInfo] = None
 
@@ -231,12 +337,122 @@ class ChargingSession:
 
     def _apply(self, data: _ChargingStatusData) -> None:
         for field_name in _ChargingStatusData.model_fields:
-            setattr(self, field_name, getattr(data, field_name))
+            if field_name != "update_data":
+                setattr(self, field_name, getattr(data, field_name))
+
+    def _apply_status(self, status: dict) -> None:
+        """
+        Apply a raw charging_status payload. The API returns the whole
+        update_data history every time; only points newer than the last one
+        already stored are appended to the series, in place. Points without a
+        timestamp are skipped.
+        """
+        status = dict(status)
+        points = status.pop("update_data", None) or []
+        validate = _ChargingStatusData.model_validate
+        if self._client is None:
+            self._apply(validate(status))
+        else:
+            self._apply(self._client._validate(validate, status))
+        self._merge_updates(points)
+
+    def _merge_updates(self, points: List[dict]) -> None:
+        if self.update_data is None:
+            self.update_data = SessionTimeSeries()
+        series = self.update_data
+        last = series.timestamps[-1] if series else None
+        for point in points:
+            timestamp = point.get("timestamp")
+            # Untimed points can neither be placed in the series nor matched
+            # against stored ones on the next refresh, so they are skipped.
+            if timestamp is None or (last is not None and timestamp <= last):
+                continue
+            series.append_raw(
+                float(timestamp),
+                float(point.get("energy_kwh", 0.0)),
+                float(point.get("power_kw", 0.0)),
+            )
 
-    async def async_refresh(self) -> None:
+    async def async_refresh(self, timeout: Optional[float] = None) -> None:
         assert (
             self._client is not None
         ), "ChargingSession._client must be set before calling async_refresh()"
+        with span(
+            "ChargingSession.refresh", {"chargepoint.session_id": self.session_id}
+        ):
+            async with deadline(timeout):
+                await self._refresh()
+
+    def _watched_fields(self) -> Dict[str, Any]:
+        return {
+            name: getattr(self, name)
+            for name in _ChargingStatusData.model_fields
+            if name != "update_data"
+        }
+
+    async def watch(
+        self,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        idle_backoff: float = 2.0,
+    ) -> AsyncIterator[SessionChange]:
+        """
+        Poll the session every ``update_period`` seconds (at least
+        ``min_interval``) and yield a SessionChange whenever a poll finds new
+        update_data points or changed fields. While the session is idle (no new
+        points, no power or fully charged) the interval grows by
+        ``idle_backoff`` up to ``max_interval``. The iterator ends after the
+        poll that sees one of SESSION_ENDED_STATES.
+        """
+        assert (
+            self._client is not None
+        ), "ChargingSession._client must be set before calling watch()"
+        # An unpopulated session is fetched straight away and reported in full.
+        delay = 0.0 if self.start_time is None else None
+        while True:
+            base = max(min_interval, float(self.update_period))
+            await asyncio.sleep(base if delay is None else delay)
+            before = self._watched_fields() if self.start_time is not None else {}
+            seen = len(self.update_data or [])
+
+            await self.async_refresh()
+
+            changes = {
+                name: value
+                for name, value in self._watched_fields().items()
+                if name not in before or before[name] != value
+            }
+            updates = (self.update_data or [])[seen:]
+            if changes or updates:
+                yield SessionChange(changes=changes, updates=updates)
+
+            state = self.charging_state.lower()
+            if state in SESSION_ENDED_STATES:
+                return
+            base = max(min_interval, float(self.update_period))
+            if updates and self.power_kw > 0 and state not in SESSION_IDLE_STATES:
+                delay = base
+            else:
+                delay = min(
+                    max(max_interval, base), max(delay or 0.0, base) * idle_backoff
+                )
+
+    @classmethod
+    def from_status(
+        cls, session_id: int, status: dict, client: Optional[ChargePoint] = None
+    ) -> ChargingSession:
+        """Validate a raw charging_status payload, e.g. from get_charging_session(raw=True)."""
+        session = cls(session_id=session_id)
+        session._client = client
+        session._apply_status(status)
+        return session
+
+    async def _refresh(self) -> None:
+        assert self._client is not None
+        self._apply_status(await self._fetch_status())
+
+    async def _fetch_status(self) -> dict:
+        assert self._client is not None
         _LOGGER.debug("Getting session information for session %s", self.session_id)
 
         response = await self._client._request(
@@ -252,7 +468,7 @@ class ChargingSession:
                 response=response, message="Failed to get charging session data."
             )
 
-        json_data = await response.json()
+        json_data = await self._client._read_json(response)
         status = json_data.get("charging_status", {})
 
         if (
@@ -265,23 +481,59 @@ class ChargingSession:
             )
 
         _LOGGER.debug("Passed session fetch: %s", json_data)
-        self._apply(_ChargingStatusData.model_validate(status))
+        return status
 
-    async def stop(self) -> None:
+    async def stop(self, timeout: Optional[float] = None) -> None:
         assert (
             self._client is not None
         ), "ChargingSession._client must be set before calling stop()"
-        await _send_command(
-            client=self._client,
-            action="stop",
-            device_id=self.device_id,
-            port_number=self.outlet_number,
-            session_id=self.session_id,
-        )
+        with span("ChargingSession.stop", {"chargepoint.session_id": self.session_id}):
+            async with deadline(timeout):
+                await _send_command(
+                    client=self._client,
+                    action="stop",
+                    device_id=self.device_id,
+                    port_number=self.outlet_number,
+                    session_id=self.session_id,
+                )
+
+    @classmethod
+    async def start(
+        cls, device_id: int, client: ChargePoint, timeout: Optional[float] = None
+    ) -> ChargingSession:
+        with span("ChargingSession.start", {"chargepoint.device_id": device_id}):
+            async with deadline(timeout):
+                return await cls._start(device_id, client)
 
     @classmethod
-    async def start(cls, device_id: int, client: ChargePoint) -> ChargingSession:
+    async def _start(cls, device_id: int, client: ChargePoint) -> ChargingSession:
         await _send_command(client=client, action="start", device_id=device_id)
+        return await cls._resolve_started(client)
+
+    @classmethod
+    async def begin(
+        cls, device_id: int, client: ChargePoint, timeout: Optional[float] = None
+    ) -> PendingChargingSession:
+        """
+        Send a start command and return as soon as the API accepts it. The
+        acknowledgement polling and session lookup continue in the background;
+        await the returned handle for the ChargingSession.
+        """
+        with span("ChargingSession.begin", {"chargepoint.device_id": device_id}):
+            async with deadline(timeout):
+                ack_id = await _submit_command(client, "start", device_id)
+        confirmation = client._spawn(cls._confirm_start(client, ack_id))
+        return PendingChargingSession(device_id, ack_id, confirmation)
+
+    @classmethod
+    async def _confirm_start(cls, client: ChargePoint, ack_id: Any) -> ChargingSession:
+        # Runs in its own task: the deadline of the begin() call does not apply.
+        detach()
+        await _await_ack(client, "start", ack_id)
+        return await cls._resolve_started(client)
+
+    @classmethod
+    async def _resolve_started(cls, client: ChargePoint) -> ChargingSession:
         # So, after wayyy too much trial and error, I noticed that the "sessionId"
         # returned by the start session API is significantly higher than normal
         # session IDs... I have no clue what it means, so we are just going to
@@ -293,3 +545,39 @@ class ChargingSession:
         session._client = client
         await session.async_refresh()
         return session
+
+
+class PendingChargingSession:
+    """
+    A start command the API has accepted but the station has not confirmed yet,
+    returned by ChargingSession.begin(). ``confirmation`` is a task that waits for
+    the acknowledgement, resolves the new session ID and returns the refreshed
+    ChargingSession; awaiting the handle awaits that task. Closing the client
+    cancels pending confirmations.
+    """
+
+    def __init__(
+        self, device_id: int, ack_id: Any, confirmation: asyncio.Task[ChargingSession]
+    ):
+        self.device_id = device_id
+        self.ack_id = ack_id
+        self.confirmation = confirmation
+        confirmation.add_done_callback(self._log_failure)
+
+    def done(self) -> bool:
+        return self.confirmation.done()
+
+    def cancel(self) -> bool:
+        """Stop waiting for confirmation. The start command itself is not undone."""
+        return self.confirmation.cancel()
+
+    def __await__(self) -> Generator[Any, None, ChargingSession]:
+        return self.confirmation.__await__()
+
+    def _log_failure(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.warning(
+                "Charging session on device %s was not confirmed: %s",
+                self.device_id,
+                task.exception(),
+            )
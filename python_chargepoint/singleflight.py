@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from .deadline import detach
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    deduplicated: int = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+
+    The first caller for a key starts the work; callers arriving while it is in
+    flight await the same result (or exception) instead of repeating it.
+    The shared work runs without the first caller's deadline; each caller's own
+    deadline only bounds how long that caller waits for it.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.stats.calls += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.deduplicated += 1
+        else:
+            task = asyncio.ensure_future(self._run(fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        # Shield the shared task so one caller being cancelled does not cancel
+        # the work the other callers are waiting for.
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _run(fn: Callable[[], Awaitable[Any]]) -> Any:
+        detach()
+        return await fn()
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
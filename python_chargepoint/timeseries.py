@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from typing import Any, Iterable, Iterator, List, Sequence, Union, overload
+
+from .types import ChargingSessionUpdate, _parse_ms_timestamp
+
+
+class SessionTimeSeries(Sequence[ChargingSessionUpdate]):
+    """
+    Columnar storage for a charging session's update_data.
+
+    Points are kept in three ``array("d")`` columns: ``timestamps`` (epoch
+    milliseconds, as sent by the API), ``energy_kwh`` and ``power_kw``. Indexing
+    and iteration build ChargingSessionUpdate objects on demand, so the series
+    can be used like the list it replaces; prefer the columns and helpers when
+    processing many points. Points are expected in ascending timestamp order.
+    """
+
+    __slots__ = ("timestamps", "energy_kwh", "power_kw")
+
+    def __init__(self, updates: Iterable[ChargingSessionUpdate] = ()):
+        self.timestamps = array("d")
+        self.energy_kwh = array("d")
+        self.power_kw = array("d")
+        for update in updates:
+            self.append(update)
+
+    def append(self, update: ChargingSessionUpdate) -> None:
+        self.append_raw(
+            update.timestamp.timestamp() * 1000, update.energy_kwh, update.power_kw
+        )
+
+    def append_raw(
+        self, timestamp_ms: float, energy_kwh: float, power_kw: float
+    ) -> None:
+        self.timestamps.append(timestamp_ms)
+        self.energy_kwh.append(energy_kwh)
+        self.power_kw.append(power_kw)
+
+    def _point(self, index: int) -> ChargingSessionUpdate:
+        return ChargingSessionUpdate.model_construct(
+            energy_kwh=self.energy_kwh[index],
+            power_kw=self.power_kw[index],
+            timestamp=_parse_ms_timestamp(self.timestamps[index]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> ChargingSessionUpdate: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ChargingSessionUpdate]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[ChargingSessionUpdate, List[ChargingSessionUpdate]]:
+        if isinstance(index, slice):
+            return [self._point(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SessionTimeSeries index out of range")
+        return self._point(index)
+
+    def __iter__(self) -> Iterator[ChargingSessionUpdate]:
+        return (self._point(i) for i in range(len(self)))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SessionTimeSeries):
+            return (
+                self.timestamps == other.timestamps
+                and self.energy_kwh == other.energy_kwh
+                and self.power_kw == other.power_kw
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SessionTimeSeries({len(self)} points)"
+
+    def average_power(self) -> float:
+        """Time-weighted mean of power_kw, in kW (trapezoidal rule)."""
+        if len(self) < 2:
+            return self.power_kw[0] if len(self) else 0.0
+        ts, power = self.timestamps, self.power_kw
+        duration = ts[-1] - ts[0]
+        if duration <= 0:
+            return sum(power) / len(power)
+        area = sum(
+            (ts[i] - ts[i - 1]) * (power[i] + power[i - 1]) / 2
+            for i in range(1, len(ts))
+        )
+        return area / duration
+
+    def energy_deltas(self) -> array:
+        """Energy added between consecutive points, in kWh (one fewer than points)."""
+        energy = self.energy_kwh
+        return array("d", (energy[i] - energy[i - 1] for i in range(1, len(energy))))
+
+    def resample(self, interval: float) -> SessionTimeSeries:
+        """
+        Return a series with one point every ``interval`` seconds from the first
+        timestamp, linearly interpolating energy and power.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        resampled = SessionTimeSeries()
+        if not self:
+            return resampled
+        ts = self.timestamps
+        step = interval * 1000
+        count = int((ts[-1] - ts[0]) // step) + 1
+        for n in range(count):
+            at = ts[0] + n * step
+            i = bisect_right(ts, at)
+            if i >= len(ts):
+                resampled.append_raw(at, self.energy_kwh[-1], self.power_kw[-1])
+                continue
+            # ts[i - 1] <= at < ts[i]
+            fraction = (at - ts[i - 1]) / (ts[i] - ts[i - 1])
+            resampled.append_raw(
+                at,
+                _lerp(self.energy_kwh[i - 1], self.energy_kwh[i], fraction),
+                _lerp(self.power_kw[i - 1], self.power_kw[i], fraction),
+            )
+        return resampled
+
+
+def _lerp(start: float, end: float, fraction: float) -> float:
+    return start + (end - start) * fraction
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from .constants import _LOGGER
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+
+class TokenStore(ABC):
+    """
+    Base class for stores that share coulomb session tokens between processes.
+
+    ChargePoint.create() uses a stored token when none is given, and the client
+    writes the token back whenever the API hands out a new one, so every worker
+    using the same store shares one session per account. Errors are logged
+    and otherwise ignored. Subclasses implement ``_read``, ``_write`` and
+    ``_delete``.
+    """
+
+    @staticmethod
+    def _key(username: str) -> str:
+        return username.strip().lower()
+
+    def get(self, username: str) -> Optional[str]:
+        try:
+            return self._read(self._key(username))
+        except (OSError, sqlite3.Error) as exc:
+            _LOGGER.warning("Failed to read token store: %s", exc)
+            return None
+
+    def set(self, username: str, token: str) -> None:
+        try:
+            self._write(self._key(username), token)
+        except (OSError, sqlite3.Error) as exc:
+            _LOGGER.warning("Failed to write token store: %s", exc)
+
+    def delete(self, username: str) -> None:
+        try:
+            self._delete(self._key(username))
+        except (OSError, sqlite3.Error) as exc:
+            _LOGGER.warning("Failed to write token store: %s", exc)
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[str]:
+        """Return the token stored under ``key``, or None."""
+
+    @abstractmethod
+    def _write(self, key: str, token: str) -> None:
+        """Store ``token`` under ``key``, replacing any previous token."""
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        """Remove the token stored under ``key``, if any."""
+
+
+class FileTokenStore(TokenStore):
+    """
+    Stores one token file per username in ``directory``. Writers take an
+    advisory lock (where fcntl is available) and replace the file atomically.
+    Token files are created readable by the owner only.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+
+    def _path(self, key: str, suffix: str = ".token") -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{digest}{suffix}"
+
+    @contextmanager
+    def _locked(self, key: str, exclusive: bool) -> Iterator[None]:
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self._path(key, ".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with self._locked(key, exclusive=False):
+            return path.read_text().strip() or None
+
+    def _write(self, key: str, token: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._locked(key, exclusive=True):
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as file:
+                    file.write(token)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+    def _delete(self, key: str) -> None:
+        with self._locked(key, exclusive=True):
+            self._path(key).unlink(missing_ok=True)
+
+
+class SQLiteTokenStore(TokenStore):
+    """
+    Stores tokens in a single SQLite database file at ``path``. A new database
+    file is created readable by the owner only.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        # Create the file ourselves so sqlite3 does not create it umask-readable.
+        os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+        with closing(sqlite3.connect(self.path)) as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS tokens "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, token TEXT NOT NULL)"
+            )
+
+    def _read(self, key: str) -> Optional[str]:
+        with closing(sqlite3.connect(self.path)) as db:
+            row = db.execute(
+                "SELECT token FROM tokens WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _write(self, key: str, token: str) -> None:
+        with closing(sqlite3.connect(self.path)) as db, db:
+            db.execute(
+                "INSERT OR REPLACE INTO tokens (key, stored_at, token) VALUES (?, ?, ?)",
+                (key, time.time(), token),
+            )
+
+    def _delete(self, key: str) -> None:
+        with closing(sqlite3.connect(self.path)) as db, db:
+            db.execute("DELETE FROM tokens WHERE key = ?", (key,))
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Optional
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore[assignment]
+
+TRACER_NAME = "python_chargepoint"
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> ContextManager[Any]:
+    """
+    Start an OpenTelemetry span that becomes the parent of spans started inside
+    the block. Without opentelemetry installed this is a no-op that yields None.
+    """
+    if trace is None:
+        return nullcontext()
+    return trace.get_tracer(TRACER_NAME).start_as_current_span(
+        name, attributes=attributes
+    )
+
+
+def set_response_status(current: Any, status: int) -> None:
+    """Record an HTTP status on a span from span(), marking 4xx/5xx as errors."""
+    if current is None:
+        return
+    current.set_attribute("http.response.status_code", status)
+    if status >= 400:
+        current.set_status(Status(StatusCode.ERROR))
@@ -1,7 +1,29 @@
+import sys
 from datetime import datetime, timezone
-from typing import List, Optional, Union
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from functools import lru_cache
+from typing import (
+    Any,
+    ForwardRef,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Type,
+    Union,
+    get_args,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    create_model,
+    field_validator,
+    model_validator,
+)
 from pydantic.alias_generators import to_camel
 
 from .constants import _LOGGER
@@ -13,7 +35,10 @@ def _parse_ms_timestamp(v: float) -> datetime:
 
 
 class _BaseModel(BaseModel):
-    """Base for all library models. Passes through undeclared API fields for diagnostic use."""
+    """
+    Base for all library models. Passes through undeclared API fields for
+    diagnostic use, unless set_extra_fields("ignore") has been called.
+    """
 
     model_config = ConfigDict(extra="allow")
 
@@ -449,3 +474,111 @@ class MapStation(_BaseModel):
     is_home: bool = False
     charging_status: Optional[str] = None
     charging_info: Optional[MapChargingInfo] = None
+
+
+class _MapData(BaseModel):
+    stations: List[MapStation] = Field(default_factory=list)
+
+
+class _MapResponse(BaseModel):
+    """Envelope of map API responses, validated straight from raw JSON bytes."""
+
+    map_data: _MapData = Field(default_factory=_MapData)
+
+
+def projection(model: Type[BaseModel], fields: Iterable[str]) -> Type[BaseModel]:
+    """
+    Return a slim model containing only ``fields`` of a flat response model such
+    as MapStation or StationInfo. Undeclared API fields are ignored rather than
+    kept, so projected objects are cheaper to parse and hold. Projections are
+    cached, so repeated calls with the same fields return the same class.
+    """
+    return _projection(model, frozenset(fields))
+
+
+@lru_cache(maxsize=64)
+def _projection(model: Type[BaseModel], fields: FrozenSet[str]) -> Type[BaseModel]:
+    unknown = fields - set(model.model_fields)
+    if unknown:
+        raise ValueError(
+            f"Unknown {model.__name__} fields: {', '.join(sorted(unknown))}"
+        )
+    definitions: dict = {
+        name: (info.annotation, info)
+        for name, info in model.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        f"{model.__name__}Projection",
+        __config__=ConfigDict(**{**model.model_config, "extra": "ignore"}),
+        __module__=__name__,
+        **definitions,
+    )
+
+
+@lru_cache(maxsize=64)
+def _map_response(station_model: Type[BaseModel]) -> Type[BaseModel]:
+    """Map API envelope whose stations are parsed as ``station_model``."""
+    data = create_model(
+        "_ProjectedMapData",
+        stations=(
+            List[station_model],  # type: ignore[valid-type]
+            Field(default_factory=list),
+        ),
+    )
+    return create_model(
+        "_ProjectedMapResponse", map_data=(data, Field(default_factory=data))
+    )
+
+
+def set_extra_fields(mode: Literal["allow", "ignore"]) -> None:
+    """
+    Choose whether library models keep undeclared API fields ("allow", the
+    default) or drop them while parsing ("ignore"). Dropping them saves memory
+    when many models are held, e.g. in a StationCache. Models are shared
+    classes, so the setting applies process-wide and only to objects parsed
+    after the call.
+    """
+    if mode not in ("allow", "ignore"):
+        raise ValueError(f"Unsupported extra fields mode: {mode}")
+    package = __name__.partition(".")[0]
+    models = [
+        m for m in _subclasses(BaseModel) if m.__module__.partition(".")[0] == package
+    ]
+    for model in models:
+        if issubclass(model, _BaseModel):
+            model.model_config["extra"] = mode
+    # Parent schemas embed their children's, so rebuild children first.
+    done: Set[type] = set()
+    for model in models:
+        _rebuild(model, set(models), done)
+    _projection.cache_clear()
+    _map_response.cache_clear()
+
+
+def _subclasses(cls: type) -> Iterator[Type[BaseModel]]:
+    sub: Type[BaseModel]
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _subclasses(sub)
+
+
+def _model_types(annotation: Any, namespace: dict) -> Iterator[Type[BaseModel]]:
+    if isinstance(annotation, ForwardRef):
+        annotation = namespace.get(annotation.__forward_arg__)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _model_types(arg, namespace)
+
+
+def _rebuild(model: Type[BaseModel], models: Set[type], done: Set[type]) -> None:
+    if model in done:
+        return
+    done.add(model)
+    namespace = vars(sys.modules[model.__module__])
+    for info in model.model_fields.values():
+        for dependency in _model_types(info.annotation, namespace):
+            if dependency in models:
+                _rebuild(dependency, models, done)
+    model.model_rebuild(force=True)
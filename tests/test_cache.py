@@ -0,0 +1,270 @@
+import asyncio
+import time
+
+import pytest
+from yarl import URL
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.cache import (
+    DiscoveryCache,
+    FileDiscoveryCache,
+    SQLiteDiscoveryCache,
+    StationCache,
+)
+from python_chargepoint.constants import DISCOVERY_API
+from python_chargepoint.global_config import GlobalConfiguration
+from python_chargepoint.types import StationInfo
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def discovery_cache(request, tmp_path) -> DiscoveryCache:
+    if request.param == "file":
+        return FileDiscoveryCache(tmp_path / "discovery")
+    return SQLiteDiscoveryCache(tmp_path / "discovery.db")
+
+
+def test_discovery_cache_round_trip(
+    discovery_cache: DiscoveryCache, global_config: GlobalConfiguration
+):
+    assert discovery_cache.get("test") is None
+
+    discovery_cache.set("Test", global_config)
+    entry = discovery_cache.get("test")
+
+    assert entry is not None
+    assert entry.age < 5
+    assert entry.config.model_dump(mode="json") == global_config.model_dump(mode="json")
+
+
+def test_file_discovery_cache_ignores_corrupt_entry(
+    tmp_path, global_config: GlobalConfiguration
+):
+    cache = FileDiscoveryCache(tmp_path)
+    cache.set("test", global_config)
+    cache._path(cache._key("test")).write_text("{not json")
+
+    assert cache.get("test") is None
+
+
+def test_discovery_cache_subclass_must_implement_hooks():
+    class ReadOnlyCache(DiscoveryCache):
+        def _read(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        ReadOnlyCache()
+
+
+def test_discovery_cache_ignores_invalid_config(discovery_cache: DiscoveryCache):
+    discovery_cache._write("test", '{"defaultCountry": "nowhere"}', time.time())
+
+    assert discovery_cache.get("test") is None
+
+
+async def test_create_uses_fresh_cache_entry(
+    aioresponses, discovery_cache: DiscoveryCache, global_config: GlobalConfiguration
+):
+    discovery_cache.set("test", global_config)
+
+    # No discovery response is registered, so any discovery request would fail.
+    client = await ChargePoint.create("test", discovery_cache=discovery_cache)
+
+    assert client.global_config.region == global_config.region
+    await client.close()
+
+
+async def test_create_populates_cache(
+    aioresponses, discovery_cache: DiscoveryCache, global_config_json: dict
+):
+    aioresponses.post(DISCOVERY_API, status=200, payload=global_config_json)
+
+    client = await ChargePoint.create("test", discovery_cache=discovery_cache)
+    await client.close()
+
+    entry = discovery_cache.get("test")
+    assert entry is not None
+    assert entry.config.region == "NA-US"
+
+
+async def test_create_ignores_expired_cache_entry(
+    aioresponses,
+    tmp_path,
+    global_config: GlobalConfiguration,
+    global_config_json: dict,
+):
+    cache = FileDiscoveryCache(tmp_path, ttl=60)
+    cache._write(
+        "test",
+        global_config.model_copy(update={"region": "STALE"}).model_dump_json(
+            by_alias=True
+        ),
+        time.time() - 120,
+    )
+    aioresponses.post(DISCOVERY_API, status=200, payload=global_config_json)
+
+    client = await ChargePoint.create("test", discovery_cache=cache)
+    await client.close()
+
+    assert client.global_config.region == "NA-US"
+    assert cache.get("test").config.region == "NA-US"
+
+
+async def test_create_revalidates_stale_cache_entry(
+    aioresponses,
+    tmp_path,
+    global_config: GlobalConfiguration,
+    global_config_json: dict,
+):
+    cache = FileDiscoveryCache(tmp_path, ttl=3600, revalidate_after=60)
+    cache._write(
+        "test",
+        global_config.model_copy(update={"region": "STALE"}).model_dump_json(
+            by_alias=True
+        ),
+        time.time() - 120,
+    )
+    aioresponses.post(DISCOVERY_API, status=200, payload=global_config_json)
+
+    client = await ChargePoint.create("test", discovery_cache=cache)
+    assert client.global_config.region == "STALE"
+
+    for task in list(client._background_tasks):
+        await task
+    await client.close()
+
+    assert client.global_config.region == "NA-US"
+    assert cache.get("test").config.region == "NA-US"
+
+
+@pytest.mark.parametrize(
+    "failure", [{"status": 500}, {"exception": asyncio.TimeoutError()}]
+)
+async def test_failed_revalidation_keeps_cache_entry(
+    aioresponses, tmp_path, global_config: GlobalConfiguration, failure: dict
+):
+    cache = FileDiscoveryCache(tmp_path, ttl=3600, revalidate_after=0)
+    cache.set("test", global_config)
+    aioresponses.post(DISCOVERY_API, **failure)
+
+    client = await ChargePoint.create("test", discovery_cache=cache)
+    for task in list(client._background_tasks):
+        await task
+    await client.close()
+
+    assert cache.get("test").config.region == global_config.region
+
+
+def test_station_cache_lru_eviction(station_info_json: dict):
+    cache = StationCache(max_size=2)
+    for device_id in (1, 2, 3):
+        cache.put(
+            StationInfo.model_validate({**station_info_json, "deviceId": device_id})
+        )
+
+    assert len(cache) == 2
+    assert cache.get(1) is None
+    assert cache.get(2) is not None
+
+    # 2 was just used, so 3 is now the least recently used entry.
+    cache.put(StationInfo.model_validate({**station_info_json, "deviceId": 4}))
+    assert cache.get(3) is None
+    assert cache.get(2) is not None
+
+    cache.invalidate(2)
+    assert cache.get(2) is None
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_station_cache_static_expiry(station_info_json: dict):
+    cache = StationCache(static_ttl=0)
+    cache.put(StationInfo.model_validate(station_info_json))
+
+    assert cache.get(99991111) is None
+
+
+def _station_url(client: ChargePoint) -> URL:
+    return (
+        client.global_config.endpoints.mapcache_endpoint
+        / "v3/station/info"
+        % {
+            "deviceId": "99991111",
+            "use_cache": "false",
+        }
+    )
+
+
+async def test_get_station_uses_cache(
+    aioresponses, authenticated_client: ChargePoint, station_info_json: dict
+):
+    authenticated_client._station_cache = cache = StationCache()
+    aioresponses.get(_station_url(authenticated_client), payload=station_info_json)
+
+    first = await authenticated_client.get_station(99991111)
+    second = await authenticated_client.get_station(99991111)
+
+    assert first is second
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+
+async def test_get_station_refreshes_status_from_map(
+    aioresponses,
+    authenticated_client: ChargePoint,
+    station_info_json: dict,
+    nearby_stations_json: dict,
+):
+    authenticated_client._station_cache = cache = StationCache(status_ttl=0)
+    aioresponses.get(_station_url(authenticated_client), payload=station_info_json)
+    map_station = nearby_stations_json["map_data"]["stations"][0]
+    map_station["station_status_v2"] = "in_use"
+    map_station["ports"][0]["status_v2"] = "in_use"
+    aioresponses.post(
+        authenticated_client.global_config.endpoints.mapcache_endpoint / "v2",
+        payload=nearby_stations_json,
+    )
+
+    await authenticated_client.get_station(99991111)
+    info = await authenticated_client.get_station(99991111)
+
+    assert info.station_status_v2 == "in_use"
+    assert info.ports_info.ports[0].status_v2 == "in_use"
+    assert info.address.city == "Testville"
+    assert cache.stats.status_refreshes == 1
+
+
+async def test_get_station_refetches_when_missing_from_map(
+    aioresponses,
+    authenticated_client: ChargePoint,
+    station_info_json: dict,
+):
+    authenticated_client._station_cache = cache = StationCache(status_ttl=0)
+    aioresponses.get(
+        _station_url(authenticated_client), payload=station_info_json, repeat=True
+    )
+    aioresponses.post(
+        authenticated_client.global_config.endpoints.mapcache_endpoint / "v2",
+        status=500,
+    )
+
+    await authenticated_client.get_station(99991111)
+    await authenticated_client.get_station(99991111)
+
+    assert cache.stats.misses == 2
+    assert cache.stats.status_refreshes == 0
+
+
+async def test_get_station_without_location_skips_map(
+    aioresponses,
+    authenticated_client: ChargePoint,
+    station_info_json: dict,
+):
+    authenticated_client._station_cache = cache = StationCache(status_ttl=0)
+    station_info_json.update(latitude=0.0, longitude=0.0)
+    aioresponses.get(
+        _station_url(authenticated_client), payload=station_info_json, repeat=True
+    )
+
+    await authenticated_client.get_station(99991111)
+    await authenticated_client.get_station(99991111)
+
+    assert cache.stats.misses == 2
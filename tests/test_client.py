@@ -1,3 +1,5 @@
+import asyncio
+import json
 import logging
 import time
 from http.cookies import SimpleCookie
@@ -820,6 +822,90 @@ async def test_client_get_nearby_stations(
     assert home.charging_info.vehicle_info.make == "TestMake"
 
 
+async def test_client_get_nearby_stations_raw(
+    aioresponses, authenticated_client: ChargePoint, nearby_stations_json: dict
+):
+    from python_chargepoint.global_config import ZoomBounds
+    from python_chargepoint.types import MapStation
+
+    aioresponses.post(
+        authenticated_client.global_config.endpoints.mapcache_endpoint / "v2",
+        status=200,
+        payload=nearby_stations_json,
+    )
+    bounds = ZoomBounds(sw_lat=0.0, sw_lon=0.0, ne_lat=1.0, ne_lon=1.0)
+    stations = await authenticated_client.get_nearby_stations(bounds, raw=True)
+
+    assert stations == nearby_stations_json["map_data"]["stations"]
+    assert MapStation.model_validate(stations[0]).device_id == 99991111
+
+
+async def test_client_get_nearby_stations_projection(
+    aioresponses, authenticated_client: ChargePoint, nearby_stations_json: dict
+):
+    from python_chargepoint.global_config import ZoomBounds
+
+    aioresponses.post(
+        authenticated_client.global_config.endpoints.mapcache_endpoint / "v2",
+        status=200,
+        payload=nearby_stations_json,
+    )
+    bounds = ZoomBounds(sw_lat=0.0, sw_lon=0.0, ne_lat=1.0, ne_lon=1.0)
+    stations = await authenticated_client.get_nearby_stations(
+        bounds, fields=["device_id", "lat", "lon", "station_status_v2", "ports"]
+    )
+
+    assert len(stations) == 2
+    public = stations[0]
+    assert public.device_id == 99991111
+    assert public.station_status_v2 == "available"
+    assert public.ports[0].available_power == 7.2
+    assert not hasattr(public, "charging_info")
+    assert public.model_extra is None
+
+
+async def test_client_get_station_projection(
+    aioresponses, authenticated_client: ChargePoint, station_info_json: dict
+):
+    aioresponses.get(
+        authenticated_client.global_config.endpoints.mapcache_endpoint
+        / "v3/station/info"
+        % {"deviceId": "99991111", "use_cache": "false"},
+        status=200,
+        payload=station_info_json,
+    )
+
+    info = await authenticated_client.get_station(
+        99991111, fields=["device_id", "station_status_v2"]
+    )
+
+    assert info.device_id == 99991111
+    assert info.station_status_v2 == "available"
+    assert not hasattr(info, "ports_info")
+
+
+async def test_client_get_station_raw(
+    aioresponses, authenticated_client: ChargePoint, station_info_json: dict
+):
+    from python_chargepoint.cache import StationCache
+    from python_chargepoint.types import StationInfo
+
+    authenticated_client._station_cache = StationCache()
+    aioresponses.get(
+        authenticated_client.global_config.endpoints.mapcache_endpoint
+        / "v3/station/info"
+        % {"deviceId": "99991111", "use_cache": "false"},
+        status=200,
+        payload=station_info_json,
+    )
+
+    info = await authenticated_client.get_station(99991111, raw=True)
+
+    assert info == station_info_json
+    assert StationInfo.model_validate(info).device_id == 99991111
+    assert len(authenticated_client._station_cache) == 0
+
+
 async def test_client_get_nearby_stations_with_filter(
     aioresponses, authenticated_client: ChargePoint, nearby_stations_json: dict
 ):
@@ -883,3 +969,285 @@ async def test_start_session(
     new = await authenticated_client.start_charging_session(device_id=1)
     assert new.session_id == 1
     assert "Successfully confirmed start command." in caplog.text
+
+
+async def test_client_state_round_trip(aioresponses, authenticated_client: ChargePoint):
+    state = json.loads(json.dumps(authenticated_client.to_state()))
+    assert "user-agent" not in state["headers"]
+
+    # No discovery or account responses are registered for the restored client.
+    aioresponses.get(
+        authenticated_client.global_config.endpoints.hcpo_hcm_endpoint
+        / "api/v1/configuration/users/1/chargers",
+        status=200,
+        payload={"data": [{"id": "1234567890"}]},
+    )
+    restored = ChargePoint.from_state(state)
+    try:
+        assert restored.user_id == authenticated_client.user_id
+        assert restored.coulomb_token == authenticated_client.coulomb_token
+        assert restored.global_config.region == "NA-US"
+        assert restored._request_headers == authenticated_client._request_headers
+        assert await restored.get_home_chargers() == [1234567890]
+    finally:
+        await restored.close()
+
+
+async def test_client_state_requires_login():
+    async with aiohttp.ClientSession() as session:
+        client = ChargePoint("test", session=session)
+        with pytest.raises(RuntimeError):
+            client.to_state()
+
+
+async def test_client_from_state_rejects_unknown_version(
+    authenticated_client: ChargePoint,
+):
+    state = {**authenticated_client.to_state(), "v": 999}
+    with pytest.raises(ValueError):
+        ChargePoint.from_state(state)
+
+
+async def test_client_without_cookie_jar(
+    aioresponses,
+    global_config_json: dict,
+    global_config: GlobalConfiguration,
+    account_json: dict,
+):
+    token = "rAnDomBaSe64EnCodEdDaTaToKeNrAnDomBaSe64EnCodEdD#D???????#RNA-US"
+    refreshed = "rEfReSheDbAsE64EnCodEdDaTaToKeNrEfReSheDbAsE64En#D???????#RNA-US"
+    sent_cookies = []
+
+    def capture(url, **kwargs):
+        sent_cookies.append(kwargs["headers"].get("Cookie"))
+
+    aioresponses.post(DISCOVERY_API, status=200, payload=global_config_json)
+    aioresponses.get(
+        f"{global_config.endpoints.accounts_endpoint}v1/driver/profile/user",
+        payload=account_json,
+        callback=capture,
+        headers={"Set-Cookie": f"coulomb_sess={token}; Max-Age=7200; Path=/"},
+    )
+    aioresponses.get(
+        f"{global_config.endpoints.accounts_endpoint}v1/driver/profile/user",
+        payload=account_json,
+        callback=capture,
+        headers={"Set-Cookie": f"coulomb_sess={refreshed}; Max-Age=7200; Path=/"},
+    )
+
+    client = await ChargePoint.create("test", coulomb_token=token, use_cookie_jar=False)
+    try:
+        assert isinstance(client.session.cookie_jar, aiohttp.DummyCookieJar)
+        assert client.coulomb_token == token
+        assert client._request_headers["cp-session-token"] == token
+
+        await client.get_account()
+
+        assert client.coulomb_token == refreshed
+        assert client._request_headers["cp-session-token"] == refreshed
+        assert sent_cookies[0] == f'coulomb_sess="{token}"'
+        assert sent_cookies[1] == f'coulomb_sess="{token}"'
+    finally:
+        await client.close()
+
+
+async def test_client_without_cookie_jar_skips_unchanged_token(mocker):
+    client = ChargePoint("test", coulomb_token="tok", use_cookie_jar=False)
+    store = mocker.spy(client, "_store_coulomb_token")
+
+    client._set_coulomb_token("tok")
+    client._set_coulomb_token("tok%23")
+
+    assert store.call_count == 1
+    assert client.coulomb_token == "tok#"
+    await client.close()
+
+
+async def test_client_without_cookie_jar_logout(
+    aioresponses, global_config_json: dict, global_config: GlobalConfiguration
+):
+    aioresponses.post(DISCOVERY_API, status=200, payload=global_config_json)
+    aioresponses.post(f"{global_config.endpoints.sso_endpoint}v1/user/logout")
+
+    client = await ChargePoint.create("test", use_cookie_jar=False)
+    client._set_coulomb_token("tok")
+    await client.logout()
+
+    assert client.coulomb_token is None
+    await client.close()
+
+
+async def test_client_coalesces_concurrent_reads(
+    aioresponses, authenticated_client: ChargePoint, home_charger_json: dict
+):
+    # Registered once: a second network request would fail.
+    aioresponses.get(
+        f"{authenticated_client.global_config.endpoints.hcpo_hcm_endpoint}api/v1/configuration/users/1/chargers/1234567890/status",
+        status=200,
+        payload=home_charger_json,
+    )
+    before = authenticated_client.single_flight_stats.deduplicated
+
+    results = await asyncio.gather(
+        *(authenticated_client.get_home_charger_status(1234567890) for _ in range(3))
+    )
+
+    assert all(r is results[0] for r in results)
+    assert authenticated_client.single_flight_stats.deduplicated - before == 2
+
+
+async def test_client_coalesces_model_arguments(
+    aioresponses, authenticated_client: ChargePoint, nearby_stations_json: dict
+):
+    from python_chargepoint.global_config import ZoomBounds
+
+    aioresponses.post(
+        authenticated_client.global_config.endpoints.mapcache_endpoint / "v2",
+        status=200,
+        payload=nearby_stations_json,
+    )
+
+    results = await asyncio.gather(
+        authenticated_client.get_nearby_stations(ZoomBounds(ne_lat=1.0)),
+        authenticated_client.get_nearby_stations(ZoomBounds(ne_lat=1.0)),
+    )
+
+    assert results[0] is results[1]
+
+
+async def _relogin_client(aioresponses, global_config_json: dict, account_json, **kw):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(
+        "https://account.chargepoint.com/account/v1/driver/profile/user",
+        payload=account_json,
+    )
+    return await ChargePoint.create("test", "old-token", **kw)
+
+
+def _charger_status_url(client: ChargePoint, charger_id: int) -> str:
+    return (
+        f"{client.global_config.endpoints.hcpo_hcm_endpoint}"
+        f"api/v1/configuration/users/{client.user_id}/chargers/{charger_id}/status"
+    )
+
+
+async def test_client_relogin_is_single_flight(
+    aioresponses, global_config_json: dict, account_json, home_charger_json: dict
+):
+    logins = 0
+
+    async def relogin(client: ChargePoint):
+        nonlocal logins
+        logins += 1
+        await asyncio.sleep(0.01)
+        client._set_coulomb_token("new-token")
+
+    client = await _relogin_client(
+        aioresponses, global_config_json, account_json, relogin=relogin
+    )
+    for charger_id in range(5):
+        url = _charger_status_url(client, charger_id)
+        aioresponses.get(url, status=401)
+        aioresponses.get(url, payload=home_charger_json)
+
+    results = await asyncio.gather(
+        *(client.get_home_charger_status(charger_id) for charger_id in range(5))
+    )
+
+    assert [r.charger_id for r in results] == list(range(5))
+    assert logins == 1
+    assert client.coulomb_token == "new-token"
+    await client.close()
+
+
+async def test_client_relogin_prefers_token_store(
+    aioresponses, tmp_path, global_config_json: dict, account_json, home_charger_json
+):
+    from python_chargepoint.token_store import FileTokenStore
+
+    store = FileTokenStore(tmp_path)
+    relogin_calls = []
+
+    async def relogin(client: ChargePoint):
+        relogin_calls.append(client)
+
+    client = await _relogin_client(
+        aioresponses,
+        global_config_json,
+        account_json,
+        relogin=relogin,
+        token_store=store,
+    )
+    store.set("test", "shared-token")
+    url = _charger_status_url(client, 1)
+    aioresponses.get(url, status=401)
+    aioresponses.get(url, payload=home_charger_json)
+
+    await client.get_home_charger_status(1)
+
+    assert relogin_calls == []
+    assert client.coulomb_token == "shared-token"
+    await client.close()
+
+
+async def test_client_relogin_does_not_resend_start_command(
+    aioresponses,
+    global_config_json: dict,
+    account_json,
+    user_charging_status_json: dict,
+    charging_status_json: dict,
+):
+    logins = 0
+
+    async def relogin(client: ChargePoint):
+        nonlocal logins
+        logins += 1
+        client._set_coulomb_token("new-token")
+
+    client = await _relogin_client(
+        aioresponses, global_config_json, account_json, relogin=relogin
+    )
+    endpoints = client.global_config.endpoints
+    start_url = f"{endpoints.accounts_endpoint}v1/driver/station/startsession"
+    ack_url = f"{endpoints.accounts_endpoint}v1/driver/station/session/ack"
+    aioresponses.post(start_url, payload={"ackId": 1})
+    # The session expires while the start is being confirmed.
+    aioresponses.post(ack_url, status=401)
+    aioresponses.post(ack_url, payload={})
+    aioresponses.post(
+        f"{endpoints.mapcache_endpoint}v2",
+        payload={"user_status": user_charging_status_json},
+    )
+    aioresponses.post(
+        endpoints.internal_api_gateway_endpoint / "driver-bff/v1/sessions/1",
+        payload={"charging_status": charging_status_json},
+    )
+
+    session = await client.start_charging_session(device_id=1)
+
+    assert session.session_id == 1
+    assert logins == 1
+    assert len(aioresponses.requests[("POST", URL(start_url))]) == 1
+    acks = aioresponses.requests[("POST", URL(ack_url))]
+    assert [call.kwargs["data"] for call in acks] == [acks[0].kwargs["data"]] * 2
+    await client.close()
+
+
+async def test_client_relogin_failure_is_not_retried(
+    aioresponses, global_config_json: dict, account_json
+):
+    async def relogin(client: ChargePoint):
+        # The session is rejected again while logging back in.
+        await client.get_account()
+
+    client = await _relogin_client(
+        aioresponses, global_config_json, account_json, relogin=relogin
+    )
+    aioresponses.get(_charger_status_url(client, 1), status=401)
+    aioresponses.get(
+        "https://account.chargepoint.com/account/v1/driver/profile/user", status=401
+    )
+
+    with pytest.raises(InvalidSession):
+        await client.get_home_charger_status(1)
+    await client.close()
@@ -0,0 +1,64 @@
+import pytest
+
+from python_chargepoint import ChargePoint, codec
+from python_chargepoint.codec import JSONCodec, OrjsonCodec, default_codec
+from python_chargepoint.constants import DISCOVERY_API
+
+_PROFILE = "https://account.chargepoint.com/account/v1/driver/profile/user"
+
+
+def test_stdlib_codec_round_trip():
+    json_codec = JSONCodec()
+    data = json_codec.dumps({"a": [1, 2.5, None], "b": "ü"})
+    assert data == b'{"a":[1,2.5,null],"b":"\\u00fc"}'
+    assert json_codec.loads(data) == {"a": [1, 2.5, None], "b": "ü"}
+
+
+def test_orjson_codec_round_trip():
+    pytest.importorskip("orjson")
+    orjson_codec = OrjsonCodec()
+    assert orjson_codec.loads(orjson_codec.dumps({"a": [1, None]})) == {"a": [1, None]}
+    assert isinstance(default_codec(), OrjsonCodec)
+
+
+def test_default_codec_without_orjson(monkeypatch):
+    monkeypatch.setattr(codec, "orjson", None)
+    assert type(default_codec()) is JSONCodec
+    with pytest.raises(RuntimeError):
+        OrjsonCodec()
+
+
+class _CountingCodec(JSONCodec):
+    def __init__(self):
+        self.decoded = 0
+        self.encoded = []
+
+    def loads(self, data: bytes):
+        self.decoded += 1
+        return super().loads(data)
+
+    def dumps(self, obj) -> bytes:
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+
+async def test_client_uses_custom_codec(
+    aioresponses, global_config_json: dict, account_json: dict, home_charger_json: dict
+):
+    json_codec = _CountingCodec()
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=account_json)
+    client = await ChargePoint.create("test", "token", codec=json_codec)
+
+    url = (
+        f"{client.global_config.endpoints.hcpo_hcm_endpoint}"
+        f"api/v1/configuration/users/{client.user_id}/chargers/1/status"
+    )
+    aioresponses.get(url, payload=home_charger_json)
+    status = await client.get_home_charger_status(1)
+
+    assert status.charger_id == 1
+    assert json_codec.decoded == 1
+    # The discovery request body went through the codec too.
+    assert json_codec.encoded[0]["username"] == "test"
+    await client.close()
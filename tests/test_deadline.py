@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.deadline import deadline, detach, remaining
+from python_chargepoint.exceptions import DeadlineExceeded
+
+
+async def test_deadline_raises_typed_exception():
+    with pytest.raises(DeadlineExceeded):
+        async with deadline(0.01):
+            await asyncio.sleep(1)
+
+
+async def test_deadline_unbounded():
+    async with deadline(None):
+        assert remaining() is None
+        await asyncio.sleep(0)
+
+
+async def test_deadline_nested_never_extends_outer():
+    with pytest.raises(DeadlineExceeded):
+        async with deadline(0.05):
+            outer = remaining()
+            async with deadline(10):
+                assert remaining() == pytest.approx(outer, abs=0.01)
+                await asyncio.sleep(1)
+
+
+async def test_deadline_nested_shorter_inner():
+    async with deadline(10):
+        with pytest.raises(DeadlineExceeded):
+            async with deadline(0.01):
+                assert remaining() <= 0.01
+                await asyncio.sleep(1)
+        assert remaining() > 5
+
+
+async def test_deadline_passes_through_unrelated_timeouts():
+    with pytest.raises(asyncio.TimeoutError) as exc:
+        async with deadline(10):
+            raise asyncio.TimeoutError()
+    assert not isinstance(exc.value, DeadlineExceeded)
+
+
+async def _slow(url, **kwargs):
+    await asyncio.sleep(1)
+
+
+async def test_client_call_timeout(
+    aioresponses, authenticated_client: ChargePoint, account_json: dict
+):
+    aioresponses.get(
+        f"{authenticated_client.global_config.endpoints.accounts_endpoint}v1/driver/profile/user",
+        payload=account_json,
+        callback=_slow,
+    )
+
+    with pytest.raises(DeadlineExceeded):
+        await authenticated_client.get_account(timeout=0.01)
+
+
+async def test_session_stop_timeout_covers_ack_polling(
+    aioresponses, authenticated_client: ChargePoint, charging_session
+):
+    endpoint = authenticated_client.global_config.endpoints.accounts_endpoint
+    aioresponses.post(f"{endpoint}v1/driver/station/stopSession", payload={"ackId": 1})
+    aioresponses.post(
+        f"{endpoint}v1/driver/station/session/ack", status=202, repeat=True
+    )
+
+    with pytest.raises(DeadlineExceeded):
+        await charging_session.stop(timeout=0.05)
+
+
+async def test_session_start_timeout(aioresponses, authenticated_client: ChargePoint):
+    endpoint = authenticated_client.global_config.endpoints.accounts_endpoint
+    aioresponses.post(f"{endpoint}v1/driver/station/startsession", payload={"ackId": 1})
+    aioresponses.post(
+        f"{endpoint}v1/driver/station/session/ack", status=202, repeat=True
+    )
+
+    with pytest.raises(DeadlineExceeded):
+        await authenticated_client.start_charging_session(1, timeout=0.05)
+
+
+async def test_client_default_timeout(
+    aioresponses, authenticated_client: ChargePoint, account_json: dict
+):
+    authenticated_client._timeout = 0.01
+    aioresponses.get(
+        f"{authenticated_client.global_config.endpoints.accounts_endpoint}v1/driver/profile/user",
+        payload=account_json,
+        callback=_slow,
+    )
+
+    with pytest.raises(DeadlineExceeded):
+        await authenticated_client.get_account()
+
+
+async def test_detach_drops_inherited_deadline():
+    async def background():
+        detach()
+        return remaining()
+
+    async with deadline(10):
+        task = asyncio.ensure_future(background())
+        assert remaining() is not None
+    assert await task is None
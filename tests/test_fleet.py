@@ -0,0 +1,196 @@
+import asyncio
+import json
+from contextlib import aclosing
+
+import pytest
+
+from python_chargepoint.client import ChargePoint
+from python_chargepoint.exceptions import CommunicationError
+from python_chargepoint.fleet import BulkCommandReport, HomeChargerSnapshot
+
+CHARGER_ID = 1234567890
+
+
+def _mock_charger(
+    aioresponses,
+    client: ChargePoint,
+    charger_id: int,
+    status_json: dict,
+    tech_info_json: dict,
+    schedule_json: dict,
+    config_status: int = 500,
+):
+    endpoint = client.global_config.endpoints.hcpo_hcm_endpoint
+    charger = f"api/v1/configuration/users/1/chargers/{charger_id}"
+    aioresponses.get(endpoint / f"{charger}/status", status=200, payload=status_json)
+    aioresponses.get(
+        endpoint / f"{charger}/technical-info", status=200, payload=tech_info_json
+    )
+    aioresponses.get(
+        endpoint / f"{charger}/configurations",
+        status=config_status,
+        payload={"settings": {"serialNumber": "214841066755"}},
+    )
+    aioresponses.get(
+        endpoint / f"api/v1/schedule/charger/{charger_id}/schedule",
+        status=200,
+        payload=schedule_json,
+    )
+
+
+async def test_home_charger_snapshots_reports_partial_failures(
+    aioresponses,
+    authenticated_client: ChargePoint,
+    home_charger_json: dict,
+    home_charger_tech_info_json: dict,
+    home_charger_schedule_json: dict,
+):
+    _mock_charger(
+        aioresponses,
+        authenticated_client,
+        CHARGER_ID,
+        home_charger_json,
+        home_charger_tech_info_json,
+        home_charger_schedule_json,
+    )
+
+    (snapshot,) = await authenticated_client.get_home_charger_snapshots([CHARGER_ID])
+
+    assert isinstance(snapshot, HomeChargerSnapshot)
+    assert snapshot.charger_id == CHARGER_ID
+    assert snapshot.status is not None
+    assert snapshot.status.amperage_limit == 28
+    assert snapshot.technical_info is not None
+    assert snapshot.technical_info.software_version == "1.2.3.4"
+    assert snapshot.schedule is not None
+    assert snapshot.config is None
+    assert snapshot.ok is False
+    assert list(snapshot.errors) == ["config"]
+    assert isinstance(snapshot.errors["config"], CommunicationError)
+
+
+async def test_home_charger_snapshots_defaults_to_all_chargers(
+    aioresponses,
+    authenticated_client: ChargePoint,
+    home_charger_json: dict,
+    home_charger_tech_info_json: dict,
+    home_charger_schedule_json: dict,
+):
+    aioresponses.get(
+        authenticated_client.global_config.endpoints.hcpo_hcm_endpoint
+        / "api/v1/configuration/users/1/chargers",
+        status=200,
+        payload={"data": [{"id": "1"}, {"id": "2"}]},
+    )
+    for charger_id in (1, 2):
+        _mock_charger(
+            aioresponses,
+            authenticated_client,
+            charger_id,
+            home_charger_json,
+            home_charger_tech_info_json,
+            home_charger_schedule_json,
+            config_status=200,
+        )
+
+    snapshots = await authenticated_client.get_home_charger_snapshots(concurrency=2)
+
+    assert [s.charger_id for s in snapshots] == [1, 2]
+    assert all(s.ok for s in snapshots)
+    assert snapshots[0].config is not None
+    assert snapshots[0].config.serial_number == "214841066755"
+
+
+async def test_home_charger_snapshots_rejects_invalid_concurrency(
+    authenticated_client: ChargePoint,
+):
+    with pytest.raises(ValueError):
+        await authenticated_client.get_home_charger_snapshots(
+            [CHARGER_ID], concurrency=0
+        )
+
+
+def _amperage_url(client: ChargePoint, charger_id: int):
+    return (
+        client.global_config.endpoints.hcpo_hcm_endpoint
+        / f"api/v1/configuration/chargers/{charger_id}/charge-amperage-limit"
+    )
+
+
+async def test_bulk_set_amperage_limit_reports_each_charger(
+    aioresponses, authenticated_client: ChargePoint
+):
+    for charger_id in (1, 2, 3):
+        aioresponses.put(
+            _amperage_url(authenticated_client, charger_id),
+            status=500 if charger_id == 2 else 200,
+        )
+
+    report = await BulkCommandReport.collect(
+        authenticated_client.bulk_set_amperage_limit([1, 2, 3], 24, concurrency=2)
+    )
+
+    assert sorted(r.charger_id for r in report.results) == [1, 2, 3]
+    assert sorted(r.charger_id for r in report.succeeded) == [1, 3]
+    (failed,) = report.failed
+    assert failed.charger_id == 2
+    assert isinstance(failed.error, CommunicationError)
+    requests = [
+        call
+        for (method, url), calls in aioresponses.requests.items()
+        if method == "PUT"
+        for call in calls
+    ]
+    assert all(
+        json.loads(call.kwargs["data"]) == {"chargeAmperageLimit": 24}
+        for call in requests
+    )
+
+
+async def test_bulk_commands_stream_results_and_stop_early(
+    aioresponses, authenticated_client: ChargePoint, home_charger_schedule_json: dict
+):
+    endpoint = authenticated_client.global_config.endpoints.hcpo_hcm_endpoint
+    for charger_id in (1, 2):
+        aioresponses.put(
+            endpoint / f"api/v1/schedule/charger/{charger_id}/schedule",
+            status=200,
+            payload=home_charger_schedule_json,
+        )
+    for charger_id in range(1, 6):
+        aioresponses.put(
+            endpoint / f"api/v1/configuration/chargers/{charger_id}/led-brightness",
+            status=200,
+        )
+
+    async for result in authenticated_client.bulk_set_home_charger_schedule(
+        [1, 2], "23:00", "07:00", "19:00", "15:00", rate=100.0
+    ):
+        assert result.ok
+        assert result.result.default_schedule is not None
+
+    async with aclosing(
+        authenticated_client.bulk_set_led_brightness(range(1, 6), 3, concurrency=1)
+    ) as stream:
+        async for result in stream:
+            assert result.ok
+            break
+
+    # Leaving the block cancelled the commands still waiting for a slot; only
+    # the first and the one that took its slot were sent.
+    await asyncio.sleep(0.01)
+    brightness = [
+        url
+        for (method, url) in aioresponses.requests
+        if str(url).endswith("led-brightness")
+    ]
+    assert len(brightness) <= 2
+
+
+async def test_bulk_commands_reject_invalid_concurrency(
+    authenticated_client: ChargePoint,
+):
+    with pytest.raises(ValueError):
+        await BulkCommandReport.collect(
+            authenticated_client.bulk_set_amperage_limit([1], 24, concurrency=0)
+        )
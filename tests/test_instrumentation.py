@@ -0,0 +1,81 @@
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.constants import DISCOVERY_API
+from python_chargepoint.instrumentation import (
+    Histogram,
+    Instrumentation,
+    current_operation,
+    operation,
+)
+
+_PROFILE = "https://account.chargepoint.com/account/v1/driver/profile/user"
+
+
+def test_histogram_buckets():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.mean == (0.05 + 0.1 + 0.5 + 3.0) / 4
+    assert Histogram().mean == 0.0
+
+
+def test_operation_label():
+    assert current_operation() == "unknown"
+    with operation("outer"):
+        with operation("inner"):
+            assert current_operation() == "inner"
+        assert current_operation() == "outer"
+    assert current_operation() == "unknown"
+
+
+async def test_client_records_phases(
+    aioresponses, global_config_json: dict, account_json: dict, home_charger_json: dict
+):
+    instrumentation = Instrumentation()
+    seen = []
+    instrumentation.add_callback(lambda op, phase, sec: seen.append((op, phase)))
+
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=account_json)
+    client = await ChargePoint.create("test", "token", instrumentation=instrumentation)
+    assert client.instrumentation is instrumentation
+
+    aioresponses.get(
+        f"{client.global_config.endpoints.hcpo_hcm_endpoint}"
+        f"api/v1/configuration/users/{client.user_id}/chargers/1/status",
+        payload=home_charger_json,
+    )
+    await client.get_home_charger_status(1)
+    await client.close()
+
+    for phase in ("read", "decode", "validate", "total"):
+        assert ("get_home_charger_status", phase) in seen
+        assert instrumentation.histograms[("get_home_charger_status", phase)].count == 1
+    assert instrumentation.histograms[("get_account", "validate")].count == 1
+
+
+async def test_trace_config_records_connection_phases():
+    async def handler(request):
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    instrumentation = Instrumentation()
+
+    async with TestServer(app, host="127.0.0.1") as server:
+        url = f"http://localhost:{server.port}/"
+        async with aiohttp.ClientSession(
+            trace_configs=[instrumentation.trace_config()]
+        ) as session:
+            with operation("probe"):
+                async with session.get(url) as response:
+                    await response.read()
+
+    for phase in ("dns", "connect", "ttfb"):
+        assert instrumentation.histograms[("probe", phase)].count == 1
@@ -0,0 +1,118 @@
+import pytest
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.cache import StationCache
+from python_chargepoint.constants import DISCOVERY_API
+from python_chargepoint.exceptions import CommunicationError, InvalidSession
+from python_chargepoint.instrumentation import Histogram
+from python_chargepoint.metrics import Metrics
+from python_chargepoint.session import ChargingSession
+
+_PROFILE = "https://account.chargepoint.com/account/v1/driver/profile/user"
+_HOST = "mc.chargepoint.com"
+
+
+@pytest.fixture
+async def metered_client(aioresponses, global_config_json: dict, account_json: dict):
+    metrics = Metrics()
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=account_json)
+    client = await ChargePoint.create(
+        "test", "token", metrics=metrics, station_cache=StationCache()
+    )
+    yield client
+    await client.close()
+
+
+def _status_url(client: ChargePoint) -> str:
+    return (
+        f"{client.global_config.endpoints.hcpo_hcm_endpoint}"
+        f"api/v1/configuration/users/{client.user_id}/chargers/1/status"
+    )
+
+
+async def test_metrics_count_requests_and_errors(
+    aioresponses, metered_client: ChargePoint, home_charger_json: dict
+):
+    metrics = metered_client.metrics
+    url = _status_url(metered_client)
+    aioresponses.get(url, payload=home_charger_json)
+    aioresponses.get(url, status=401)
+    aioresponses.get(url, status=403, payload={"url": "https://captcha"})
+
+    await metered_client.get_home_charger_status(1)
+    with pytest.raises(InvalidSession):
+        await metered_client.get_home_charger_status(1)
+    with pytest.raises(CommunicationError):
+        await metered_client.get_home_charger_status(1)
+
+    host = metered_client.global_config.endpoints.hcpo_hcm_endpoint.host
+    for status in ("200", "401", "403"):
+        assert metrics.requests[("get_home_charger_status", host, status)] == 1
+    assert metrics.request_duration[("get_home_charger_status", host)].count == 3
+    assert metrics.errors == {"invalid_session": 1, "datadome_captcha": 1}
+    assert all(count == 0 for count in metrics.in_flight.values())
+
+    text = metrics.render()
+    assert (
+        'chargepoint_requests_total{operation="get_home_charger_status",'
+        f'host="{host}",status="200"}} 1'
+    ) in text
+    assert 'chargepoint_errors_total{type="datadome_captcha"} 1' in text
+    assert 'chargepoint_read_calls_total{coalesced="false"} 4' in text
+    assert "chargepoint_station_cache_hit_ratio 0" in text
+    assert text.endswith("# EOF\n")
+
+
+async def test_metrics_record_ack_attempts(
+    aioresponses,
+    metered_client: ChargePoint,
+    charging_status_json: dict,
+):
+    endpoints = metered_client.global_config.endpoints
+    aioresponses.post(
+        endpoints.internal_api_gateway_endpoint / "driver-bff/v1/sessions/1",
+        payload={"charging_status": charging_status_json},
+    )
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/stopSession",
+        payload={"ackId": 1},
+    )
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/session/ack", payload={}
+    )
+
+    session: ChargingSession = await metered_client.get_charging_session(1)
+    await session.stop()
+
+    histogram = metered_client.metrics.ack_attempts[("stop", "confirmed")]
+    assert histogram.count == 1
+    assert histogram.sum == 1
+    assert (
+        'chargepoint_command_ack_attempts_bucket{action="stop",outcome="confirmed",'
+        'le="1.0"} 1'
+    ) in metered_client.metrics.render()
+    assert metered_client.metrics.ack_duration[("stop", "confirmed")].count == 1
+    assert (
+        'chargepoint_command_ack_duration_seconds_count{action="stop",'
+        'outcome="confirmed"} 1'
+    ) in metered_client.metrics.render()
+
+
+def test_render_histogram_and_escaping():
+    metrics = Metrics()
+    histogram = metrics.request_duration[('op "x"', "host")] = Histogram((0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+
+    lines = metrics.render().splitlines()
+
+    labels = 'operation="op \\"x\\"",host="host"'
+    assert (
+        f'chargepoint_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+    )
+    assert (
+        f'chargepoint_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    )
+    assert f"chargepoint_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert f"chargepoint_request_duration_seconds_sum{{{labels}}} 0.55" in lines
@@ -0,0 +1,165 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from python_chargepoint.constants import DISCOVERY_API
+from python_chargepoint.exceptions import CommunicationError
+from python_chargepoint.global_config import GlobalConfiguration
+from python_chargepoint.pool import ChargePointPool
+from python_chargepoint.ratelimit import RateLimiter
+from python_chargepoint.retry import CircuitBreakers, RetryPolicy
+
+_PROFILE = "https://account.chargepoint.com/account/v1/driver/profile/user"
+
+
+def _profile(user_id: int, username: str) -> dict:
+    return {
+        "user": {"userId": user_id, "username": username},
+        "accountBalance": {"balance": {"amount": "0.0", "currency": "USD"}},
+    }
+
+
+async def test_pool_isolates_account_tokens(aioresponses, global_config_json: dict):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json, repeat=True)
+    aioresponses.get(_PROFILE, payload=_profile(1, "alice"))
+    aioresponses.get(_PROFILE, payload=_profile(2, "bob"))
+
+    async with ChargePointPool() as pool:
+        pool.add_account("alice", coulomb_token="alice-token")
+        pool.add_account("bob", coulomb_token="bob-token")
+        assert pool.usernames == ["alice", "bob"]
+
+        async with pool.client("alice") as alice:
+            assert alice.coulomb_token == "alice-token"
+            assert alice.user_id == 1
+        async with pool.client("bob") as bob:
+            assert bob.coulomb_token == "bob-token"
+            assert bob.user_id == 2
+
+        assert alice.session is bob.session is pool.session
+        assert alice.global_config is bob.global_config
+        assert pool.session.connector is pool.connector
+
+        # The second borrow reuses the already initialised client.
+        async with pool.client("alice") as again:
+            assert again is alice
+
+
+async def test_pool_lazy_login(
+    aioresponses,
+    global_config_json: dict,
+    global_config: GlobalConfiguration,
+):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.post(
+        f"{global_config.endpoints.sso_endpoint}v1/user/login",
+        headers={
+            "Set-Cookie": "coulomb_sess=fresh-token; Domain=.chargepoint.com; Path=/"
+        },
+    )
+    aioresponses.get(_PROFILE, payload=_profile(1, "alice"))
+    calls = []
+
+    async def login(client):
+        calls.append(client)
+        await client.login_with_password("secret")
+
+    async with ChargePointPool() as pool:
+        pool.add_account("alice", login=login)
+        assert calls == []
+
+        await asyncio.gather(*(_borrow(pool, "alice") for _ in range(3)))
+
+        assert len(calls) == 1
+        assert calls[0].coulomb_token == "fresh-token"
+
+
+async def test_pool_shares_client_options(aioresponses, global_config_json: dict):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json, repeat=True)
+    aioresponses.get(_PROFILE, payload=_profile(1, "alice"))
+    aioresponses.get(_PROFILE, payload=_profile(2, "bob"))
+    rate_limiter = RateLimiter()
+    retry_policy = RetryPolicy()
+    circuit_breakers = CircuitBreakers()
+
+    async with ChargePointPool(
+        rate_limiter=rate_limiter,
+        retry_policy=retry_policy,
+        circuit_breakers=circuit_breakers,
+        timeout=5,
+    ) as pool:
+        pool.add_account("alice", coulomb_token="alice-token")
+        pool.add_account("bob", coulomb_token="bob-token")
+        async with pool.client("alice") as alice, pool.client("bob") as bob:
+            for client in (alice, bob):
+                assert client._rate_limiter is rate_limiter
+                assert client._retry_policy is retry_policy
+                assert client._circuit_breakers is circuit_breakers
+                assert client._timeout == 5
+
+
+async def _borrow(pool: ChargePointPool, username: str) -> None:
+    async with pool.client(username):
+        pass
+
+
+async def test_pool_bounds_per_account_concurrency(
+    aioresponses, global_config_json: dict
+):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=_profile(1, "alice"))
+    active = 0
+    peak = 0
+
+    async def work():
+        nonlocal active, peak
+        async with pool.client("alice"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async with ChargePointPool(per_account_limit=2) as pool:
+        pool.add_account("alice", coulomb_token="alice-token")
+        await asyncio.gather(*(work() for _ in range(6)))
+
+    assert peak == 2
+
+
+async def test_pool_add_account_validation():
+    pool = ChargePointPool()
+    with pytest.raises(ValueError):
+        pool.add_account("alice")
+
+    pool.add_account("alice", coulomb_token="token")
+    with pytest.raises(ValueError):
+        pool.add_account("alice", coulomb_token="token")
+
+    await pool.remove_account("alice")
+    assert pool.usernames == []
+    await pool.close()
+
+
+async def test_pool_leaves_caller_connector_open():
+    connector = aiohttp.TCPConnector()
+    async with ChargePointPool(connector=connector) as pool:
+        assert pool.session.connector is connector
+    assert not connector.closed
+    await connector.close()
+
+    async with ChargePointPool() as pool:
+        owned = pool.connector
+    assert owned.closed
+
+
+async def test_pool_failed_login_can_be_retried(aioresponses, global_config_json: dict):
+    aioresponses.post(DISCOVERY_API, status=500)
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=_profile(1, "alice"))
+
+    async with ChargePointPool() as pool:
+        pool.add_account("alice", coulomb_token="alice-token")
+        with pytest.raises(CommunicationError):
+            await _borrow(pool, "alice")
+        await _borrow(pool, "alice")
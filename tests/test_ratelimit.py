@@ -0,0 +1,65 @@
+import pytest
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.ratelimit import RateLimiter, TokenBucket, shared_rate_limiter
+
+
+async def test_token_bucket_burst_then_waits(mocker):
+    sleep = mocker.patch("python_chargepoint.ratelimit.asyncio.sleep")
+    bucket = TokenBucket(rate=10.0, burst=2)
+
+    await bucket.acquire()
+    await bucket.acquire()
+    sleep.assert_not_called()
+
+    await bucket.acquire()
+    sleep.assert_called_once()
+    assert sleep.call_args.args[0] == pytest.approx(0.1, abs=0.01)
+
+
+def test_rate_limiter_adapts_to_blocks():
+    limiter = RateLimiter(rate=10.0, backoff=0.5, recovery=1.0, headroom=0.9)
+
+    limiter.record("mc.chargepoint.com", 403)
+    assert limiter.current_rate("mc.chargepoint.com") == 5.0
+
+    for _ in range(10):
+        limiter.record("mc.chargepoint.com", 200)
+
+    # Recovery stops just below the rate that was blocked.
+    assert 9.0 <= limiter.current_rate("mc.chargepoint.com") < 9.5
+    # Other hosts are unaffected.
+    assert limiter.current_rate("account.chargepoint.com") == 10.0
+
+
+def test_rate_limiter_respects_minimum_and_host_rates():
+    limiter = RateLimiter(rate=1.0, min_rate=0.5, host_rates={"slow.example": 0.2})
+
+    for _ in range(5):
+        limiter.record("account.chargepoint.com", 403)
+
+    assert limiter.current_rate("account.chargepoint.com") == 0.5
+    assert limiter.current_rate("slow.example") == 0.2
+
+
+def test_shared_rate_limiter_is_singleton():
+    assert shared_rate_limiter() is shared_rate_limiter()
+
+
+async def test_client_uses_rate_limiter(
+    aioresponses, authenticated_client: ChargePoint, account_json: dict, mocker
+):
+    limiter = RateLimiter()
+    acquire = mocker.spy(limiter, "acquire")
+    record = mocker.spy(limiter, "record")
+    authenticated_client._rate_limiter = limiter
+    aioresponses.get(
+        f"{authenticated_client.global_config.endpoints.accounts_endpoint}v1/driver/profile/user",
+        status=200,
+        payload=account_json,
+    )
+
+    await authenticated_client.get_account()
+
+    acquire.assert_called_once_with("account.chargepoint.com")
+    record.assert_called_once_with("account.chargepoint.com", 200)
@@ -0,0 +1,177 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.deadline import deadline
+from python_chargepoint.exceptions import (
+    CircuitOpenError,
+    CommunicationError,
+    DeadlineExceeded,
+    InvalidSession,
+)
+from python_chargepoint.retry import CircuitBreaker, CircuitBreakers, RetryPolicy
+
+
+@pytest.fixture
+def no_sleep(mocker):
+    return mocker.patch("python_chargepoint.retry.asyncio.sleep")
+
+
+def test_retry_policy_delay_is_capped_and_jittered():
+    policy = RetryPolicy(base_delay=1.0, max_delay=4.0, jitter=0.5)
+
+    for attempt, ceiling in [(1, 1.0), (2, 2.0), (3, 4.0), (6, 4.0)]:
+        delay = policy.delay(attempt)
+        assert ceiling / 2 <= delay <= ceiling
+
+
+async def test_retry_policy_retries_connection_errors(no_sleep):
+    policy = RetryPolicy(attempts=3)
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise aiohttp.ClientConnectionError()
+        return "ok"
+
+    assert await policy.run(flaky) == "ok"
+    assert no_sleep.call_count == 2
+
+
+async def test_retry_policy_gives_up(no_sleep):
+    policy = RetryPolicy(attempts=2)
+
+    async def broken():
+        raise aiohttp.ClientConnectionError()
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await policy.run(broken)
+    assert no_sleep.call_count == 1
+
+
+def test_circuit_breaker_opens_and_recovers(mocker):
+    clock = mocker.patch("python_chargepoint.retry.time.monotonic", return_value=0.0)
+    breaker = CircuitBreaker("host", failure_threshold=2, reset_timeout=10.0)
+
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.return_value = 11.0
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one probe is allowed while half-open.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.return_value = 22.0
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_request()
+
+
+def _status_url(client: ChargePoint) -> str:
+    return (
+        f"{client.global_config.endpoints.hcpo_hcm_endpoint}"
+        "api/v1/configuration/users/1/chargers/1234567890/status"
+    )
+
+
+async def test_client_retries_idempotent_reads(
+    aioresponses, authenticated_client: ChargePoint, home_charger_json: dict, no_sleep
+):
+    authenticated_client._retry_policy = RetryPolicy(attempts=3)
+    aioresponses.get(_status_url(authenticated_client), status=503)
+    aioresponses.get(_status_url(authenticated_client), payload=home_charger_json)
+
+    status = await authenticated_client.get_home_charger_status(1234567890)
+
+    assert status.amperage_limit == 28
+    assert no_sleep.call_count == 1
+
+
+async def test_client_coalesced_read_keeps_retrying_after_first_caller_times_out(
+    aioresponses, authenticated_client: ChargePoint, home_charger_json: dict
+):
+    authenticated_client._retry_policy = RetryPolicy(
+        attempts=3, base_delay=0.2, max_delay=0.2
+    )
+    aioresponses.get(_status_url(authenticated_client), status=500)
+    aioresponses.get(_status_url(authenticated_client), status=500)
+    aioresponses.get(_status_url(authenticated_client), payload=home_charger_json)
+
+    hurried, patient = await asyncio.gather(
+        authenticated_client.get_home_charger_status(1234567890, timeout=0.1),
+        authenticated_client.get_home_charger_status(1234567890),
+        return_exceptions=True,
+    )
+
+    assert isinstance(hurried, DeadlineExceeded)
+    assert patient.amperage_limit == 28
+
+
+async def test_client_does_not_retry_client_errors(
+    aioresponses, authenticated_client: ChargePoint, no_sleep
+):
+    authenticated_client._retry_policy = RetryPolicy(attempts=3)
+    aioresponses.get(_status_url(authenticated_client), status=401)
+
+    with pytest.raises(InvalidSession):
+        await authenticated_client.get_home_charger_status(1234567890)
+    no_sleep.assert_not_called()
+
+
+async def test_client_circuit_breaker_fails_fast(
+    aioresponses, authenticated_client: ChargePoint
+):
+    breakers = CircuitBreakers(failure_threshold=2)
+    authenticated_client._circuit_breakers = breakers
+    aioresponses.get(_status_url(authenticated_client), status=500, repeat=True)
+
+    for _ in range(2):
+        with pytest.raises(CommunicationError):
+            await authenticated_client.get_home_charger_status(1234567890)
+
+    with pytest.raises(CircuitOpenError) as exc:
+        await authenticated_client.get_home_charger_status(1234567890)
+    assert exc.value.host == "internal-api-us.chargepoint.com"
+    # Other hosts keep working independently.
+    assert breakers.for_host("account.chargepoint.com").state == CircuitBreaker.CLOSED
+
+
+async def test_client_circuit_breaker_counts_connection_errors(
+    aioresponses, authenticated_client: ChargePoint
+):
+    authenticated_client._circuit_breakers = CircuitBreakers(failure_threshold=1)
+    aioresponses.get(
+        _status_url(authenticated_client),
+        exception=aiohttp.ClientConnectionError(),
+    )
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await authenticated_client.get_home_charger_status(1234567890)
+    with pytest.raises(CircuitOpenError):
+        await authenticated_client.get_home_charger_status(1234567890)
+
+
+async def test_retry_policy_does_not_sleep_past_deadline(no_sleep):
+    policy = RetryPolicy(attempts=3, base_delay=5.0, jitter=0.0)
+
+    async def broken():
+        raise aiohttp.ClientConnectionError()
+
+    async with deadline(1.0):
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await policy.run(broken)
+    no_sleep.assert_not_called()
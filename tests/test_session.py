@@ -1,4 +1,6 @@
+import copy
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -6,7 +8,11 @@ import pytest
 
 from python_chargepoint import ChargePoint
 from python_chargepoint.global_config import GlobalConfiguration
-from python_chargepoint.session import ChargingSession, _send_command
+from python_chargepoint.session import (
+    AckPollingStrategy,
+    ChargingSession,
+    _send_command,
+)
 from python_chargepoint.exceptions import CommunicationError
 
 
@@ -127,6 +133,28 @@ async def test_start_session(
     assert "Successfully confirmed start command." in caplog.text
 
 
+async def test_get_charging_session_raw(
+    aioresponses,
+    authenticated_client: ChargePoint,
+    charging_status_json: dict,
+    timestamp: datetime,
+):
+    aioresponses.post(
+        authenticated_client.global_config.endpoints.internal_api_gateway_endpoint
+        / "driver-bff/v1/sessions/1",
+        status=200,
+        payload={"charging_status": charging_status_json},
+    )
+
+    status = await authenticated_client.get_charging_session(session_id=1, raw=True)
+    assert status == charging_status_json
+
+    session = ChargingSession.from_status(1, status, client=authenticated_client)
+    assert session.session_id == 1
+    assert session.start_time == timestamp
+    assert session.utility.name == "Power Company"
+
+
 async def test_get_charging_session_error(
     aioresponses, authenticated_client: ChargePoint
 ):
@@ -184,3 +212,227 @@ async def test_get_charging_session_no_pricing_spec_id(
 
     session = await authenticated_client.get_charging_session(session_id=1)
     assert session.pricing_spec_id == 0
+
+
+def _add_session_poll(aioresponses, status: dict, **changes) -> dict:
+    payload = {**copy.deepcopy(status), **changes}
+    aioresponses.post(
+        "https://internal-api-us.chargepoint.com/driver-bff/v1/sessions/1",
+        status=200,
+        payload={"charging_status": payload},
+    )
+    return payload
+
+
+async def test_watch_yields_new_points_and_changes(
+    aioresponses, mocker, charging_session: ChargingSession, charging_status_json
+):
+    sleep = mocker.patch("python_chargepoint.session.asyncio.sleep")
+    last = charging_status_json["update_data"][0]["timestamp"]
+    point = {"energy_kwh": 2.0, "power_kw": 11.0, "timestamp": last + 60000}
+    charging = _add_session_poll(
+        aioresponses,
+        charging_status_json,
+        energy_kwh=2.0,
+        update_data=charging_status_json["update_data"] + [point],
+    )
+    _add_session_poll(aioresponses, charging)
+    _add_session_poll(aioresponses, charging, current_charging="done")
+
+    changes = [change async for change in charging_session.watch()]
+
+    assert len(changes) == 2
+    assert changes[0].changes == {"energy_kwh": 2.0}
+    assert [u.energy_kwh for u in changes[0].updates] == [2.0]
+    assert changes[1].changes == {"charging_state": "done"}
+    assert changes[1].updates == []
+    # Idle polls back off until the session ends.
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 1.0, 2.0]
+
+
+async def test_watch_fetches_unpopulated_session_first(
+    aioresponses, mocker, authenticated_client: ChargePoint, charging_status_json
+):
+    sleep = mocker.patch("python_chargepoint.session.asyncio.sleep")
+    _add_session_poll(aioresponses, charging_status_json, current_charging="DONE")
+    session = ChargingSession(session_id=1)
+    session._client = authenticated_client
+
+    changes = [change async for change in session.watch(min_interval=5.0)]
+
+    (change,) = changes
+    assert change.changes["charging_state"] == "DONE"
+    assert len(change.updates) == 1
+    sleep.assert_called_once_with(0.0)
+
+
+async def test_refresh_appends_only_new_points(
+    aioresponses, charging_session: ChargingSession, charging_status_json
+):
+    history = charging_session.update_data
+    first = history[0]
+    last = charging_status_json["update_data"][0]["timestamp"]
+    point = {"energy_kwh": 2.0, "power_kw": 11.0, "timestamp": last + 60000}
+    _add_session_poll(
+        aioresponses,
+        charging_status_json,
+        update_data=charging_status_json["update_data"] + [point],
+    )
+    _add_session_poll(
+        aioresponses,
+        charging_status_json,
+        update_data=[{**charging_status_json["update_data"][0], "energy_kwh": 9.0}]
+        + [point],
+    )
+
+    await charging_session.async_refresh()
+    await charging_session.async_refresh()
+
+    assert charging_session.update_data is history
+    assert history[0] == first
+    assert list(history.timestamps) == [last, last + 60000]
+    assert [u.energy_kwh for u in history] == [1.0, 2.0]
+
+
+def test_refresh_skips_untimed_points(charging_status_json):
+    untimed = {"energy_kwh": 1.0, "power_kw": 11.0}
+    status = {**charging_status_json, "update_data": [untimed]}
+    session = ChargingSession.from_status(1, status)
+
+    for _ in range(3):
+        session._apply_status(status)
+    assert len(session.update_data) == 0
+
+    # A timed point is still taken even though untimed ones came first.
+    timestamp = time.time() * 1000 - 5000
+    point = {"energy_kwh": 2.0, "power_kw": 11.0, "timestamp": timestamp}
+    session._apply_status({**status, "update_data": [untimed, point]})
+
+    assert list(session.update_data.timestamps) == [timestamp]
+    assert session.update_data[0].energy_kwh == 2.0
+
+
+def test_ack_polling_delays_grow_to_cap():
+    strategy = AckPollingStrategy(
+        first_delay=0.5, multiplier=2.0, max_delay=3.0, max_attempts=6
+    )
+    assert list(strategy.delays()) == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+async def test_ack_polling_backs_off_until_confirmed(
+    aioresponses, mocker, charging_session: ChargingSession, global_config
+):
+    sleep = mocker.patch("python_chargepoint.session.asyncio.sleep")
+    endpoint = global_config.endpoints.accounts_endpoint
+    aioresponses.post(f"{endpoint}v1/driver/station/stopSession", payload={"ackId": 1})
+    aioresponses.post(f"{endpoint}v1/driver/station/session/ack", status=202)
+    aioresponses.post(f"{endpoint}v1/driver/station/session/ack", status=202)
+    aioresponses.post(f"{endpoint}v1/driver/station/session/ack", payload={})
+
+    await charging_session.stop()
+
+    assert [c.args[0] for c in sleep.call_args_list] == [0.5, 0.75]
+
+
+async def test_ack_polling_gives_up_at_timeout(
+    aioresponses, mocker, charging_session: ChargingSession, global_config
+):
+    sleep = mocker.patch("python_chargepoint.session.asyncio.sleep")
+    charging_session._client._ack_polling = AckPollingStrategy(timeout=0.6)
+    endpoint = global_config.endpoints.accounts_endpoint
+    aioresponses.post(f"{endpoint}v1/driver/station/stopSession", payload={"ackId": 1})
+    aioresponses.post(
+        f"{endpoint}v1/driver/station/session/ack",
+        status=202,
+        payload={"errorMessage": "pending", "errorCategory": "STATION"},
+        repeat=True,
+    )
+
+    with pytest.raises(CommunicationError) as exc:
+        await charging_session.stop()
+
+    assert exc.value.message == "[STATION] pending"
+    # Polls at 0 s and 0.5 s; a third poll 0.75 s later would pass the timeout.
+    assert [c.args[0] for c in sleep.call_args_list] == [0.5]
+
+
+async def test_begin_session_returns_before_confirmation(
+    aioresponses,
+    mocker,
+    authenticated_client: ChargePoint,
+    user_charging_status_json: dict,
+    charging_status_json: dict,
+):
+    mocker.patch("python_chargepoint.session.asyncio.sleep")
+    endpoints = authenticated_client.global_config.endpoints
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/startsession",
+        payload={"ackId": 7},
+    )
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/session/ack", status=202
+    )
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/session/ack", payload={}
+    )
+    aioresponses.post(
+        f"{endpoints.mapcache_endpoint}v2",
+        payload={"user_status": user_charging_status_json},
+    )
+    aioresponses.post(
+        endpoints.internal_api_gateway_endpoint / "driver-bff/v1/sessions/1",
+        payload={"charging_status": charging_status_json},
+    )
+
+    pending = await authenticated_client.begin_charging_session(device_id=1, timeout=5)
+
+    assert pending.ack_id == 7
+    assert pending.device_id == 1
+    assert not pending.done()
+    session = await pending
+    assert pending.done()
+    assert session.session_id == 1
+    assert session.charging_state == "CHARGING"
+
+
+async def test_begin_session_reports_failed_confirmation(
+    aioresponses, authenticated_client: ChargePoint, caplog
+):
+    authenticated_client._ack_polling = AckPollingStrategy(max_attempts=1)
+    endpoints = authenticated_client.global_config.endpoints
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/startsession",
+        payload={"ackId": 7},
+    )
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/session/ack",
+        status=500,
+        payload={"errorMessage": "station offline"},
+    )
+
+    pending = await ChargingSession.begin(device_id=1, client=authenticated_client)
+
+    with pytest.raises(CommunicationError):
+        await pending.confirmation
+    assert "was not confirmed: station offline" in caplog.text
+
+
+async def test_close_cancels_pending_sessions(
+    aioresponses, authenticated_client: ChargePoint
+):
+    endpoints = authenticated_client.global_config.endpoints
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/startsession",
+        payload={"ackId": 7},
+    )
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/session/ack",
+        status=202,
+        repeat=True,
+    )
+
+    pending = await authenticated_client.begin_charging_session(device_id=1)
+    await authenticated_client.close()
+
+    assert pending.confirmation.cancelled()
+    assert pending.cancel() is False
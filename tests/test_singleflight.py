@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from python_chargepoint.singleflight import SingleFlight
+
+
+async def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return object()
+
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert flight.stats.calls == 5
+    assert flight.stats.deduplicated == 4
+
+    # Once the call completes, the next one starts fresh.
+    await flight.do("key", work)
+    assert calls == 2
+
+
+async def test_single_flight_distinct_keys():
+    flight = SingleFlight()
+
+    async def work(value):
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        flight.do("a", lambda: work(1)), flight.do("b", lambda: work(2))
+    )
+
+    assert results == [1, 2]
+    assert flight.stats.deduplicated == 0
+
+
+async def test_single_flight_shares_exceptions():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+async def test_single_flight_cancelled_caller_does_not_cancel_others():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", work))
+    second = asyncio.ensure_future(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+
+from python_chargepoint.timeseries import SessionTimeSeries
+from python_chargepoint.types import ChargingSessionUpdate
+
+START = 1_700_000_000_000.0
+
+
+def _series(*points) -> SessionTimeSeries:
+    series = SessionTimeSeries()
+    for seconds, energy, power in points:
+        series.append_raw(START + seconds * 1000, energy, power)
+    return series
+
+
+def test_list_access():
+    update = ChargingSessionUpdate(
+        energy_kwh=1.5, power_kw=7.2, timestamp=datetime.now().timestamp() * 1000
+    )
+    series = SessionTimeSeries([update])
+    series.append_raw(START, 2.0, 7.0)
+
+    assert len(series) == 2
+    assert series[0] == update
+    assert series[-1].energy_kwh == 2.0
+    assert series[1:] == [series[1]]
+    assert list(series)[0].timestamp == update.timestamp
+    assert series == [update, series[1]]
+    assert series != SessionTimeSeries([update])
+    assert series != "not a series"
+    assert repr(series) == "SessionTimeSeries(2 points)"
+    with pytest.raises(IndexError):
+        series[2]
+
+
+def test_average_power_is_time_weighted():
+    assert SessionTimeSeries().average_power() == 0.0
+    assert _series((0, 0.0, 5.0)).average_power() == 5.0
+    assert _series((0, 0.0, 4.0), (0, 0.0, 6.0)).average_power() == 5.0
+    # 10 kW for the first minute, 0 kW for the following three.
+    series = _series(
+        (0, 0.0, 10.0), (60, 0.1, 10.0), (60.001, 0.1, 0.0), (240, 0.1, 0.0)
+    )
+    assert series.average_power() == pytest.approx(2.5, rel=1e-4)
+
+
+def test_energy_deltas():
+    series = _series((0, 1.0, 0.0), (60, 1.5, 0.0), (120, 2.25, 0.0))
+    assert list(series.energy_deltas()) == [0.5, 0.75]
+    assert list(SessionTimeSeries().energy_deltas()) == []
+
+
+def test_resample_interpolates():
+    series = _series((0, 0.0, 6.0), (90, 3.0, 12.0))
+
+    resampled = series.resample(30)
+
+    assert list(resampled.timestamps) == [
+        START,
+        START + 30000,
+        START + 60000,
+        START + 90000,
+    ]
+    assert list(resampled.energy_kwh) == pytest.approx([0.0, 1.0, 2.0, 3.0])
+    assert list(resampled.power_kw) == pytest.approx([6.0, 8.0, 10.0, 12.0])
+    assert len(SessionTimeSeries().resample(30)) == 0
+    with pytest.raises(ValueError):
+        series.resample(0)
@@ -0,0 +1,203 @@
+import asyncio
+import os
+import stat
+import sys
+
+import aiohttp
+import pytest
+from yarl import URL
+
+from python_chargepoint import ChargePoint
+from python_chargepoint.constants import DISCOVERY_API
+from python_chargepoint.token_store import (
+    FileTokenStore,
+    SQLiteTokenStore,
+    TokenStore,
+)
+
+_PROFILE = "https://account.chargepoint.com/account/v1/driver/profile/user"
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def token_store(request, tmp_path) -> TokenStore:
+    if request.param == "file":
+        return FileTokenStore(tmp_path / "tokens")
+    return SQLiteTokenStore(tmp_path / "tokens.db")
+
+
+def test_token_store_round_trip(token_store: TokenStore):
+    assert token_store.get("test") is None
+
+    token_store.set("Test", "first")
+    token_store.set("test", "second")
+    assert token_store.get("TEST") == "second"
+
+    token_store.delete("test")
+    assert token_store.get("test") is None
+    token_store.delete("test")
+
+
+def test_file_token_store_errors_are_ignored(tmp_path, caplog):
+    blocker = tmp_path / "tokens"
+    blocker.write_text("not a directory")
+    store = FileTokenStore(blocker)
+
+    store.set("test", "token")
+    assert store.get("test") is None
+    store.delete("test")
+    assert "Failed to write token store" in caplog.text
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+def test_sqlite_token_store_is_private(tmp_path):
+    path = tmp_path / "tokens.db"
+    SQLiteTokenStore(path).set("test", "token")
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_token_store_subclass_must_implement_hooks():
+    class Incomplete(TokenStore):
+        def _read(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+async def test_create_uses_stored_token(
+    aioresponses, token_store: TokenStore, global_config_json: dict, account_json
+):
+    token_store.set("test", "stored-token")
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=account_json)
+
+    client = await ChargePoint.create("test", token_store=token_store)
+
+    assert client.coulomb_token == "stored-token"
+    assert client.user_id is not None
+    await client.close()
+
+
+async def test_create_drops_rejected_stored_token(
+    aioresponses, token_store: TokenStore, global_config_json: dict
+):
+    token_store.set("test", "expired-token")
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, status=401)
+
+    client = await ChargePoint.create("test", token_store=token_store)
+
+    assert client.coulomb_token is None
+    assert client.user_id is None
+    await client.close()
+
+
+async def test_refreshed_token_is_shared_and_logout_clears_it(
+    aioresponses, token_store: TokenStore, global_config_json: dict, account_json
+):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=account_json)
+    client = await ChargePoint.create("test", "first-token", token_store=token_store)
+    assert token_store.get("test") == "first-token"
+
+    aioresponses.get(
+        _PROFILE,
+        payload=account_json,
+        headers={
+            "Set-Cookie": "coulomb_sess=second-token; Domain=.chargepoint.com; Path=/"
+        },
+    )
+    await client.get_account()
+    assert token_store.get("test") == "second-token"
+
+    aioresponses.post(
+        f"{client.global_config.endpoints.sso_endpoint}v1/user/logout", payload={}
+    )
+    await client.logout()
+    assert token_store.get("test") is None
+    await client.close()
+
+
+async def test_keepalive_adopts_shared_token(
+    aioresponses, token_store: TokenStore, global_config_json: dict, account_json
+):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=account_json, repeat=True)
+    client = await ChargePoint.create(
+        "test",
+        "first-token",
+        use_cookie_jar=False,
+        token_store=token_store,
+        keepalive_interval=0.01,
+    )
+
+    # Another worker refreshes the session.
+    token_store.set("test", "other-token")
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if client.coulomb_token == "other-token":
+            break
+
+    assert client.coulomb_token == "other-token"
+    pings = [
+        call
+        for (method, url), calls in aioresponses.requests.items()
+        if str(url) == _PROFILE
+        for call in calls
+    ]
+    assert len(pings) >= 2
+    await client.close()
+
+
+async def test_keepalive_starts_for_restored_client(
+    aioresponses, global_config_json: dict, account_json
+):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=account_json, repeat=True)
+    client = await ChargePoint.create("test", "token", use_cookie_jar=False)
+    state = client.to_state()
+    await client.close()
+
+    restored = ChargePoint.from_state(
+        state, use_cookie_jar=False, keepalive_interval=0.01
+    )
+    assert restored._keepalive_task is not None
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if len(aioresponses.requests[("GET", URL(_PROFILE))]) >= 2:
+            break
+
+    assert len(aioresponses.requests[("GET", URL(_PROFILE))]) >= 2
+    await restored.close()
+
+
+async def test_keepalive_survives_transient_errors(
+    aioresponses, global_config_json: dict, account_json
+):
+    aioresponses.post(DISCOVERY_API, payload=global_config_json)
+    aioresponses.get(_PROFILE, payload=account_json)
+    aioresponses.get(_PROFILE, exception=aiohttp.ClientConnectionError("reset"))
+    aioresponses.get(_PROFILE, exception=asyncio.TimeoutError())
+    aioresponses.get(_PROFILE, payload=account_json, repeat=True)
+    client = await ChargePoint.create(
+        "test", "token", use_cookie_jar=False, keepalive_interval=0.01
+    )
+
+    def pings() -> int:
+        return sum(
+            len(calls)
+            for (method, url), calls in aioresponses.requests.items()
+            if str(url) == _PROFILE
+        )
+
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if pings() >= 5:
+            break
+
+    # create(), two failed keepalives, then successful ones.
+    assert pings() >= 5
+    assert client._keepalive_task is not None
+    assert not client._keepalive_task.done()
+    await client.close()
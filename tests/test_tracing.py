@@ -0,0 +1,122 @@
+import pytest
+
+from python_chargepoint import ChargePoint, tracing
+from python_chargepoint.global_config import GlobalConfiguration
+
+
+def test_span_is_noop_without_opentelemetry(monkeypatch):
+    monkeypatch.setattr(tracing, "trace", None)
+    with tracing.span("ChargePoint.get_account") as current:
+        assert current is None
+    tracing.set_response_status(current, 500)
+
+
+@pytest.fixture(scope="module")
+def span_exporter():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture
+def spans(span_exporter):
+    span_exporter.clear()
+    yield span_exporter
+    span_exporter.clear()
+
+
+async def test_session_start_spans(
+    spans,
+    aioresponses,
+    authenticated_client: ChargePoint,
+    global_config: GlobalConfiguration,
+    user_charging_status_json: dict,
+    charging_status_json: dict,
+):
+    endpoints = global_config.endpoints
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/startsession",
+        payload={"ackId": 1},
+    )
+    aioresponses.post(
+        f"{endpoints.accounts_endpoint}v1/driver/station/session/ack",
+        payload={"sessionId": 1},
+    )
+    aioresponses.post(
+        f"{endpoints.mapcache_endpoint}v2",
+        payload={"user_status": user_charging_status_json},
+    )
+    aioresponses.post(
+        endpoints.internal_api_gateway_endpoint / "driver-bff/v1/sessions/1",
+        payload={"charging_status": charging_status_json},
+    )
+    spans.clear()
+
+    await authenticated_client.start_charging_session(1)
+
+    finished = spans.get_finished_spans()
+    by_id = {s.context.span_id: s for s in finished}
+
+    def ancestors(s):
+        names = []
+        while s.parent is not None:
+            s = by_id[s.parent.span_id]
+            names.append(s.name)
+        return names
+
+    root = next(s for s in finished if s.parent is None)
+    assert root.name == "ChargePoint.start_charging_session"
+
+    ack = next(s for s in finished if s.name == "ChargingSession.start_command_ack")
+    assert ack.attributes["chargepoint.ack.attempts"] == 1
+    assert ancestors(ack) == [
+        "ChargingSession.start",
+        "ChargePoint.start_charging_session",
+    ]
+
+    http = [s for s in finished if s.name == "HTTP POST"]
+    assert len(http) == 4
+    assert all(s.attributes["http.response.status_code"] == 200 for s in http)
+    parents = {ancestors(s)[0] for s in http}
+    assert parents == {
+        "ChargingSession.start_command",
+        "ChargingSession.start_command_ack",
+        "ChargePoint.get_user_charging_status",
+        "ChargingSession.refresh",
+    }
+
+
+async def test_error_status_marks_span(
+    spans, aioresponses, authenticated_client: ChargePoint
+):
+    from opentelemetry.trace import StatusCode
+
+    from python_chargepoint.exceptions import CommunicationError
+
+    aioresponses.get(
+        f"{authenticated_client.global_config.endpoints.hcpo_hcm_endpoint}"
+        "api/v1/configuration/users/1/chargers/1/status",
+        status=500,
+    )
+    spans.clear()
+    with pytest.raises(CommunicationError):
+        await authenticated_client.get_home_charger_status(1)
+
+    http = next(s for s in spans.get_finished_spans() if s.name == "HTTP GET")
+    assert http.status.status_code == StatusCode.ERROR
+    method = next(
+        s
+        for s in spans.get_finished_spans()
+        if s.name == "ChargePoint.get_home_charger_status"
+    )
+    assert method.status.status_code == StatusCode.ERROR
@@ -1,11 +1,19 @@
 from datetime import datetime
+
+import pytest
+
 from python_chargepoint.types import (
     ElectricVehicle,
     Account,
     HomeChargerStatus,
     HomeChargerTechnicalInfo,
+    MapStation,
+    StationInfo,
     UserChargingStatus,
+    projection,
+    set_extra_fields,
 )
+from python_chargepoint.types import _MapResponse
 
 
 def test_electric_vehicle_from_json(electric_vehicle_json: dict):
@@ -125,3 +133,53 @@ def test_user_charging_status_unknown_state_from_json(caplog, timestamp):
 
     UserChargingStatus.model_validate(json)
     assert "Charging status returned without a state." in caplog.text
+
+
+def test_projection_keeps_only_requested_fields(station_info_json: dict):
+    model = projection(StationInfo, ["device_id", "station_status_v2", "ports_info"])
+
+    assert set(model.model_fields) == {"device_id", "station_status_v2", "ports_info"}
+    assert (
+        projection(StationInfo, ("ports_info", "device_id", "station_status_v2"))
+        is model
+    )
+
+    info = model.model_validate(station_info_json)
+    assert info.device_id == 99991111
+    assert info.ports_info.ports[0].status_v2 == "available"
+    assert info.model_extra is None
+    assert not hasattr(info, "name")
+
+
+def test_projection_unknown_field():
+    with pytest.raises(ValueError, match="Unknown MapStation fields: nope"):
+        projection(MapStation, ["device_id", "nope"])
+
+
+@pytest.fixture
+def ignore_extra_fields():
+    set_extra_fields("ignore")
+    yield
+    set_extra_fields("allow")
+
+
+def test_set_extra_fields_ignore(
+    ignore_extra_fields, station_info_json: dict, nearby_stations_json: dict
+):
+    info = StationInfo.model_validate({**station_info_json, "undeclared": 1})
+    assert info.model_extra is None
+    assert info.ports_info.ports[0].model_extra is None
+    assert info.device_id == 99991111
+
+    # Models nested in private envelopes are rebuilt too.
+    stations = _MapResponse.model_validate(nearby_stations_json).map_data.stations
+    assert stations[1].charging_info.model_extra is None
+
+    set_extra_fields("allow")
+    info = StationInfo.model_validate({**station_info_json, "undeclared": 1})
+    assert info.model_extra["undeclared"] == 1
+
+
+def test_set_extra_fields_invalid_mode():
+    with pytest.raises(ValueError):
+        set_extra_fields("forbid")